@@ -5,23 +5,51 @@ except ImportError as e:
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
-from crewai_tools import *
+from functools import lru_cache
+import copy
+import yaml
 from crewai.llm import LLM
+from litellm.llms.custom_httpx.http_handler import HTTPHandler
 import os
+import logging
 from datetime import datetime
-from dotenv import load_dotenv
+from pathlib import Path
 from tools.custom_tool import CustomPDFTool
 from schemas import DocumentAnalysisOutput, CandidateMatchingOutput, ReportGenerationOutput
 
-load_dotenv()
+logger = logging.getLogger(__name__)
+
+if not os.getenv("RESUME_SKIP_DOTENV"):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# One HTTP connection pool shared by every crew, sized for the number of
+# candidates analyzed concurrently so calls never wait on a free connection
+http_client = HTTPHandler(
+    concurrent_limit=max(64, 2 * int(os.getenv("RESUME_CONCURRENCY", "8")))
+)
 
 # Reduced temperature for more consistent results
 llm = LLM(
     model="gemini/gemini-2.5-pro",
     temperature=0.0,
-
+    client=http_client,
 )
 
+
+@lru_cache(maxsize=None)
+def _parse_config(config_path: Path) -> dict:
+    """Parse a crew YAML config file once per process."""
+    with open(config_path, "r", encoding="utf-8") as file:
+        return yaml.safe_load(file)
+
+
+def _load_config(config_path: Path) -> dict:
+    # CrewBase rewrites the loaded config in place (agent names become agent
+    # instances), so each crew gets its own copy of the parsed YAML
+    return copy.deepcopy(_parse_config(Path(config_path)))
+
+
 @CrewBase
 class Resume():
     """Resume crew"""
@@ -29,36 +57,56 @@ class Resume():
     agents_config = 'config/agents.yaml'
     tasks_config = 'config/tasks.yaml'
     
-    def __init__(self, pdf_path=None):
+    def __init__(self, pdf_path=None, work_dir=None, document_analysis=None):
         super().__init__()
-        print(f"[DEBUG] Resume class initialized with PDF path: {pdf_path}")
+        # CrewBase's wrapper class defines its own load_yaml, which would shadow one
+        # declared in this class body; it only loads the configs after this __init__
+        # returns, so an instance attribute is in place by then
+        self.load_yaml = _load_config
+        # Task output files go to a per-crew directory so that several crews
+        # can run concurrently without clobbering each other's side files
+        self.work_dir = Path(work_dir) if work_dir else Path('.')
+        # A previously computed document analysis for this resume, if any.
+        # When set, the document analysis task is skipped and the result is
+        # handed to the matching task through the {document_analysis} input.
+        self.document_analysis = document_analysis
+        logger.debug("Resume class initialized with PDF path: %s", pdf_path)
         
         if pdf_path:
             try:
                 self.pdf_tool = CustomPDFTool(pdf_path=pdf_path)
-                print(f"[DEBUG] CustomPDFTool created successfully")
-                
-                test_result = self.pdf_tool._run("extract_all")
-                print(f"[DEBUG] PDF tool test result length: {len(test_result)} characters")
+                logger.debug("CustomPDFTool created successfully")
                 
-                if test_result and len(test_result) > 0:
-                    print(f"[DEBUG] PDF content preview: {test_result[:200]}...")
+                # Extracted once here and passed to the tasks as {resume_text} so the
+                # document analyzer doesn't need a tool round trip to read the resume
+                # (the tool's content cache means a later tool call won't parse it again).
+                # Only the document analysis task reads it, so a cached analysis skips the parse
+                if document_analysis:
+                    self.resume_text = ""
                 else:
-                    print("[DEBUG] Warning: PDF extraction returned empty content")
+                    self.resume_text = self.pdf_tool._run("extract_all")
+                
+                if logger.isEnabledFor(logging.DEBUG) and not document_analysis:
+                    logger.debug("PDF tool test result length: %s characters", len(self.resume_text))
+                    if self.resume_text:
+                        logger.debug("PDF content preview: %s...", self.resume_text[:200])
+                    else:
+                        logger.debug("Warning: PDF extraction returned empty content")
                 
             except Exception as e:
-                print(f"[DEBUG] Error creating CustomPDFTool: {e}")
+                logger.debug("Error creating CustomPDFTool: %s", e)
                 raise e
         else:
             self.pdf_tool = None
-            print("[DEBUG] No PDF path provided")
+            self.resume_text = ""
+            logger.debug("No PDF path provided")
 
     @agent
     def document_analyzer(self) -> Agent:
         if self.pdf_tool is None:
             raise ValueError("PDF tool not initialized. Please provide a PDF path.")
         
-        print(f"[DEBUG] Creating document_analyzer agent with PDF tool")
+        logger.debug("Creating document_analyzer agent with PDF tool")
         
         return Agent(
             config=self.agents_config['document_analyzer'],
@@ -90,32 +138,70 @@ class Resume():
     def document_analysis_task(self) -> Task:
         return Task(
             config=self.tasks_config['document_analysis_task'],
-            output_file='document_analysis_task.json',
+            output_file=str(self.work_dir / 'document_analysis_task.json'),
             output_pydantic=DocumentAnalysisOutput
         )
     
     @task
     def candidate_matching_task(self) -> Task:
-        return Task(
+        matching_task = Task(
             config=self.tasks_config['candidate_matching_task'],
-            output_file='candidate_matching_task.json',
+            output_file=str(self.work_dir / 'candidate_matching_task.json'),
             output_pydantic=CandidateMatchingOutput
         )
+        if self.document_analysis:
+            matching_task.description += (
+                "\n\nDOCUMENT ANALYSIS OF THE CANDIDATE'S RESUME:\n{document_analysis}"
+            )
+        return matching_task
     
     @task
     def report_generation_task(self) -> Task:
         return Task(
             config=self.tasks_config['report_generation_task'], 
-            output_file='report.json',
+            output_file=str(self.work_dir / 'report.json'),
             output_json=ReportGenerationOutput
         )
     
     @crew
     def crew(self) -> Crew:
         """Creates the Resume crew"""
+        agents = self.agents
+        tasks = self.tasks
+        
+        if self.document_analysis:
+            # Reuse the cached document analysis instead of running that step again
+            document_task = self.document_analysis_task()
+            tasks = [t for t in tasks if t is not document_task]
+            agents = [a for a in agents if a is not document_task.agent]
+        
         return Crew(
-            agents=self.agents,
-            tasks=self.tasks,
+            agents=agents,
+            tasks=tasks,
             process=Process.sequential,
             verbose=True,
+        )
+
+
+class ResumeCrewFactory:
+    """
+    Builds a Resume crew per candidate.
+    The agent and task YAML files are parsed once and the LLM is shared at
+    module level; agents themselves are rebuilt for every crew because CrewAI
+    binds them to the crew that runs them, so they cannot be shared between
+    crews running concurrently.
+    """
+    
+    def __init__(self):
+        # Parse the configs up front rather than in the first worker
+        base_directory = Path(__file__).parent
+        _parse_config(base_directory / Resume.agents_config)
+        _parse_config(base_directory / Resume.tasks_config)
+    
+    def build_for(self, pdf_path: str, work_dir: Path, document_analysis: str = None) -> Resume:
+        """Build a crew that analyzes the given PDF and writes its task outputs to work_dir."""
+        return Resume(
+            pdf_path=pdf_path,
+            work_dir=work_dir,
+            document_analysis=document_analysis
         )
\ No newline at end of file
@@ -6,20 +6,29 @@ Following CrewAI best practices for clean separation of concerns.
 
 import os
 import sys
+import orjson
+import hashlib
 import logging
+import threading
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dotenv import load_dotenv
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+from uuid import uuid4
 
-from crew import Resume
-from utils.file_handler import FileHandler
+from model_utils import ModelValidator
+from utils.file_handler import FileHandler, BackgroundWriter
 from utils.barem_generator import BaremGenerator
 from utils.report_parser import ReportParser
 from utils.pdf_validator import PDFValidator
 
-# Load environment variables
-load_dotenv()
+# Load environment variables, unless the deployment already provides them
+if not os.getenv("RESUME_SKIP_DOTENV"):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # Create logs directory if it doesn't exist
 logs_dir = Path(__file__).parent.parent.parent / "logs"
@@ -36,6 +45,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+_writer: Optional[BackgroundWriter] = None
+_writer_lock = threading.Lock()
+
+
+def _shared_writer() -> BackgroundWriter:
+    """Background writer shared by every engine, so each one doesn't start its own thread."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = BackgroundWriter()
+        return _writer
+
+
 class ResumeAnalysisEngine:
     """
     Main engine for orchestrating resume analysis using CrewAI.
@@ -48,15 +71,29 @@ class ResumeAnalysisEngine:
         self.output_dir.mkdir(exist_ok=True)
         
         # Create subdirectories
-        (self.output_dir / "reports").mkdir(exist_ok=True)
+        self._reports_dir = self.output_dir / "reports"
+        self._logs_dir = self.output_dir / "logs"
+        self._reports_dir.mkdir(exist_ok=True)
         (self.output_dir / "extracts").mkdir(exist_ok=True)
-        (self.output_dir / "logs").mkdir(exist_ok=True)
+        self._logs_dir.mkdir(exist_ok=True)
+        (self.output_dir / "work").mkdir(exist_ok=True)
+        
+        # Cached analysis results and reusable document analyses
+        self.result_cache_dir = self.output_dir / "cache"
+        (self.result_cache_dir / "documents").mkdir(parents=True, exist_ok=True)
         
         # Initialize utilities
         self.file_handler = FileHandler(self.output_dir)
+        self.writer = _shared_writer()
         self.barem_generator = BaremGenerator(self.output_dir)
         self.report_parser = ReportParser()
         self.pdf_validator = PDFValidator()
+        # Built on first analysis so importing this module doesn't pull in crewai
+        self._crew_factory = None
+        self._crew_factory_lock = threading.Lock()
+        
+        # In-process memo of generated barems, on top of the barem generator's disk cache
+        self._cached_barem = lru_cache(maxsize=32)(self._load_barem)
         
         logger.info(f"Resume Analysis Engine initialized with output directory: {self.output_dir}")
     
@@ -74,11 +111,26 @@ class ResumeAnalysisEngine:
     def generate_or_load_barem(self, job_title: str, job_description: str) -> Optional[Dict]:
         """Generate or load existing barem for the job."""
         try:
-            return self.barem_generator.get_barem(job_title, job_description)
+            return self._cached_barem(job_title, job_description)
         except Exception as e:
             logger.error(f"Error generating barem: {e}")
             return None
     
+    def _get_crew_factory(self):
+        """Return the crew factory, importing crewai on first use."""
+        with self._crew_factory_lock:
+            if self._crew_factory is None:
+                from crew import ResumeCrewFactory
+                self._crew_factory = ResumeCrewFactory()
+            return self._crew_factory
+    
+    def _load_barem(self, job_title: str, job_description: str) -> Dict:
+        """Load the barem from the generator, raising on failure so it is not memoized."""
+        barem = self.barem_generator.get_barem(job_title, job_description)
+        if not barem:
+            raise ValueError(f"No barem could be generated for '{job_title}'")
+        return barem
+    
     def analyze_single_resume(
         self, 
         resume_path: str, 
@@ -102,25 +154,42 @@ class ResumeAnalysisEngine:
         """
         logger.info(f"Starting analysis for candidate: {candidate_name}")
         
+        work_dir = None
         try:
-            # Validate PDF
+            # Validate PDF (memoized, so resumes validated with the rest of their batch aren't re-read)
             is_valid, validation_message = self.pdf_validator.validate_pdf(resume_path)
             if not is_valid:
-                logger.warning(f"PDF validation failed for {candidate_name}: {validation_message}")
-                return {
-                    "candidate_name": candidate_name,
-                    "valid": False,
-                    "error": validation_message,
-                    "score": 0,
-                    "recommendation": "Failed"
-                }
+                return self._validation_failed_result(candidate_name, validation_message)
+            
+            # Return the cached result if this resume was already analyzed for this job
+            with open(resume_path, 'rb') as f:
+                pdf_hash = hashlib.sha256(f.read()).hexdigest()
+            
+            cache_key = self._result_cache_key(pdf_hash, job_title, job_description, barem)
+            cached_result = self._load_cached_result(cache_key)
+            if cached_result is not None:
+                logger.info(f"Using cached analysis for {candidate_name}")
+                return cached_result
+            
+            # The document analysis only depends on the resume, so reuse it across jobs
+            document_cache_file = self.result_cache_dir / "documents" / f"{pdf_hash}.json"
+            document_analysis = self._load_cached_document_analysis(document_cache_file)
+            if document_analysis:
+                logger.info(f"Reusing cached document analysis for {candidate_name}")
+            
+            # Isolated working directory for this crew's task output files
+            work_dir = self.output_dir / "work" / uuid4().hex
+            work_dir.mkdir(parents=True, exist_ok=True)
             
             # Create Resume crew instance
-            resume_crew = Resume(pdf_path=resume_path)
+            resume_crew = self._get_crew_factory().build_for(
+                resume_path, work_dir, document_analysis=document_analysis
+            )
             
             # Prepare inputs for crew
             inputs = {
                 'pdf': resume_path,
+                'resume_text': resume_crew.resume_text,
                 'job_title': job_title,
                 'job_description': job_description,
                 'current_year': str(datetime.now().year)
@@ -129,6 +198,9 @@ class ResumeAnalysisEngine:
             if barem:
                 inputs['barem'] = barem
             
+            if document_analysis:
+                inputs['document_analysis'] = document_analysis
+            
             # Execute crew analysis
             logger.info(f"Executing crew analysis for {candidate_name}")
             result = resume_crew.crew().kickoff(inputs=inputs)
@@ -136,12 +208,18 @@ class ResumeAnalysisEngine:
             # Save token usage
             self._save_token_usage(candidate_name, result.token_usage)
             
-            # Generate unique report filename and move report
-            report_filename = self._handle_report_file(candidate_name)
+            # Move the report out of the working directory under a unique filename
+            report_filename = self._handle_report_file(candidate_name, work_dir)
             
             # Parse the report
             analysis_result = self.report_parser.parse_report(report_filename, candidate_name)
             
+            # Cache the document analysis and the final result of successful runs
+            if analysis_result.get('valid'):
+                if not document_analysis:
+                    self._cache_document_analysis(work_dir, document_cache_file)
+                self._save_cached_result(cache_key, analysis_result)
+            
             logger.info(f"Analysis completed for {candidate_name} - Score: {analysis_result.get('score', 0)}")
             return analysis_result
             
@@ -154,13 +232,32 @@ class ResumeAnalysisEngine:
                 "score": 0,
                 "recommendation": "Error"
             }
+        finally:
+            # The report has been moved out and the document analysis cached by now
+            if work_dir is not None:
+                self.file_handler.schedule_cleanup(work_dir)
+    
+    @staticmethod
+    def _validation_failed_result(candidate_name: str, validation_message: str) -> Dict[str, Any]:
+        """Result returned for a resume whose PDF could not be read."""
+        logger.warning(f"PDF validation failed for {candidate_name}: {validation_message}")
+        return {
+            "candidate_name": candidate_name,
+            "valid": False,
+            "error": validation_message,
+            "score": 0,
+            "recommendation": "Failed"
+        }
     
     def analyze_multiple_resumes(
         self,
         resume_files: List[tuple],  # [(file_path, candidate_name), ...]
         job_title: str,
         job_description: str,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        top_k: Optional[int] = None,
+        barem: Optional[Dict] = None,
+        result_callback: Optional[callable] = None
     ) -> List[Dict[str, Any]]:
         """
         Analyze multiple resumes in batch.
@@ -170,88 +267,267 @@ class ResumeAnalysisEngine:
             job_title: Job title for the position
             job_description: Job description text
             progress_callback: Optional callback for progress updates
+            top_k: Optional number of best-scoring results to keep
+            barem: Optional scoring rubric, generated for the job if not given
+            result_callback: Optional callback receiving each result as soon as it completes
             
         Returns:
-            List of analysis results
+            List of analysis results, best score first
         """
         logger.info(f"Starting batch analysis of {len(resume_files)} resumes")
         
         # Generate barem once for all resumes
-        barem = self.generate_or_load_barem(job_title, job_description)
+        if barem is None:
+            barem = self.generate_or_load_barem(job_title, job_description)
         if not barem:
             logger.error("Failed to generate barem, aborting batch analysis")
+            self._discard_uploads(resume_files)
             return []
         
-        results = []
         total_files = len(resume_files)
         
-        for idx, (resume_path, candidate_name) in enumerate(resume_files):
-            # Update progress
-            if progress_callback:
-                progress_callback(idx, total_files, candidate_name)
-            
-            # Analyze single resume
-            result = self.analyze_single_resume(
-                resume_path, job_title, job_description, candidate_name, barem
-            )
-            results.append(result)
-            
-            # Clean up temporary file if needed
-            self.file_handler.cleanup_temp_file(resume_path)
+        def _results():
+            for idx, result in self.analyze_multiple_resumes_stream(
+                resume_files, job_title, job_description, barem=barem
+            ):
+                # Update progress
+                if progress_callback:
+                    progress_callback(idx, total_files, result.get('candidate_name', ''))
+                if result_callback:
+                    result_callback(idx, result)
+                yield result
         
-        # Sort results by score
-        results.sort(key=lambda x: x.get('score', 0), reverse=True)
+        # Rank results by score as they arrive, keeping only the best top_k when requested
+        if top_k is not None:
+            results = nlargest(top_k, _results(), key=itemgetter('score'))
+        else:
+            results = sorted(_results(), key=itemgetter('score'), reverse=True)
         
         # Save batch results
         self._save_batch_results(results, job_title)
+        self.writer.flush()
         
-        logger.info(f"Batch analysis completed. Processed {len(results)} resumes")
+        logger.info(f"Batch analysis completed. Processed {total_files} resumes")
         return results
     
+    def analyze_multiple_resumes_stream(
+        self,
+        resume_files: List[tuple],  # [(file_path, candidate_name), ...]
+        job_title: str,
+        job_description: str,
+        barem: Optional[Dict] = None
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Analyze multiple resumes concurrently, yielding results as they complete.
+        
+        Args:
+            resume_files: List of tuples (file_path, candidate_name)
+            job_title: Job title for the position
+            job_description: Job description text
+            barem: Optional scoring rubric, generated for the job if not given
+            
+        Yields:
+            Tuples (completion index, analysis result) in completion order
+        """
+        if barem is None:
+            barem = self.generate_or_load_barem(job_title, job_description)
+            if not barem:
+                logger.error("Failed to generate barem, aborting batch analysis")
+                self._discard_uploads(resume_files)
+                return
+        
+        max_workers = max(1, int(os.getenv("RESUME_CONCURRENCY", "8")))
+        
+        # Submit the largest resumes first so long analyses start early and short ones
+        # fill the remaining worker slots instead of straggling at the end of the batch
+        ordered_files = sorted(resume_files, key=lambda f: self._file_size(f[0]), reverse=True)
+        
+        # Validate the whole batch up front, in parallel, before any crew is started
+        validations = self.pdf_validator.validate_pdfs([resume_path for resume_path, _ in ordered_files])
+        
+        # Candidates are independent and bound by LLM latency, so run them concurrently
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = {}
+        failed = []
+        try:
+            for (resume_path, candidate_name), (is_valid, validation_message) in zip(ordered_files, validations):
+                if not is_valid:
+                    self.file_handler.schedule_cleanup(resume_path)
+                    failed.append(self._validation_failed_result(candidate_name, validation_message))
+                    continue
+                future = executor.submit(
+                    self._analyze_and_cleanup,
+                    resume_path, job_title, job_description, candidate_name, barem
+                )
+                futures[future] = resume_path
+            
+            # Unreadable resumes are reported right away, while the others are analyzed
+            for idx, result in enumerate(failed):
+                yield idx, result
+            for idx, future in enumerate(as_completed(futures), start=len(failed)):
+                yield idx, future.result()
+        finally:
+            # If the consumer stopped early, drop the analyses that haven't started
+            executor.shutdown(wait=True, cancel_futures=True)
+            for future, resume_path in futures.items():
+                if future.cancelled():
+                    self.file_handler.schedule_cleanup(resume_path)
+            # Remove the batch's temporary uploads and working directories in one pass
+            self.file_handler.flush_cleanup()
+    
+    def _analyze_and_cleanup(
+        self,
+        resume_path: str,
+        job_title: str,
+        job_description: str,
+        candidate_name: str,
+        barem: Optional[Dict]
+    ) -> Dict[str, Any]:
+        """Analyze a single resume in a worker thread and schedule its temporary file for removal."""
+        try:
+            return self.analyze_single_resume(
+                resume_path, job_title, job_description, candidate_name, barem
+            )
+        finally:
+            self.file_handler.schedule_cleanup(resume_path)
+    
+    def _discard_uploads(self, resume_files: List[tuple]) -> None:
+        """Remove the temporary uploads of a batch that won't be analyzed."""
+        for resume_path, _ in resume_files:
+            self.file_handler.schedule_cleanup(resume_path)
+        self.file_handler.flush_cleanup()
+    
+    @staticmethod
+    def _file_size(path: str) -> int:
+        """Return the file size used to estimate analysis cost, or 0 if unavailable."""
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+    
+    def _result_cache_key(
+        self,
+        pdf_hash: str,
+        job_title: str,
+        job_description: str,
+        barem: Optional[Dict]
+    ) -> str:
+        """Build the cache key for a (resume, job, barem) combination."""
+        # Whitespace-only differences in the job text (re-pasted descriptions, trailing
+        # newlines, indentation) shouldn't cause a cache miss
+        canonical_title = " ".join(job_title.split())
+        canonical_description = " ".join(job_description.split())
+        
+        hasher = hashlib.sha256()
+        for part in (pdf_hash, canonical_title, canonical_description):
+            hasher.update(part.encode('utf-8'))
+            hasher.update(b'\0')
+        hasher.update(orjson.dumps(barem, option=orjson.OPT_SORT_KEYS))
+        return hasher.hexdigest()
+    
+    def _load_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Load a cached analysis result, if any."""
+        cache_file = self.result_cache_dir / f"{cache_key}.json"
+        try:
+            with open(cache_file, 'rb') as f:
+                cached_result = orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {cache_file}: {e}")
+            return None
+        
+        # Entries that only point at a report file may point at one that has since been
+        # overwritten by another candidate's report, so they can't be trusted
+        if "report_content" not in cached_result:
+            return None
+        return cached_result
+    
+    def _save_cached_result(self, cache_key: str, analysis_result: Dict[str, Any]) -> None:
+        """Save an analysis result to the cache."""
+        try:
+            cache_file = self.result_cache_dir / f"{cache_key}.json"
+            # Keep the report text in the entry so a cache hit doesn't depend on the report file
+            report_content = self.report_parser.get_report_content(analysis_result.get("report_path"))
+            data = orjson.dumps({**analysis_result, "report_content": report_content})
+            self.file_handler.write_atomic(cache_file, data)
+        except Exception as e:
+            logger.warning(f"Failed to cache analysis result: {e}")
+    
+    def _load_cached_document_analysis(self, document_cache_file: Path) -> Optional[str]:
+        """Load a cached document analysis, treating one that doesn't validate as a miss."""
+        try:
+            data = document_cache_file.read_bytes()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable document analysis {document_cache_file}: {e}")
+            return None
+        
+        if not ModelValidator.is_valid_json(data, 'document_analysis'):
+            logger.warning(f"Ignoring invalid document analysis {document_cache_file}")
+            return None
+        return data.decode('utf-8')
+    
+    def _cache_document_analysis(self, work_dir: Path, document_cache_file: Path) -> None:
+        """Keep the crew's document analysis output so other jobs can reuse it."""
+        try:
+            data = (work_dir / "document_analysis_task.json").read_bytes()
+            # A truncated or malformed output would otherwise be reused for every later job
+            if not ModelValidator.is_valid_json(data, 'document_analysis'):
+                logger.warning("Not caching document analysis that doesn't match its schema")
+                return
+            self.file_handler.write_atomic(document_cache_file, data)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to cache document analysis: {e}")
+    
     def _save_token_usage(self, candidate_name: str, token_usage: Any) -> None:
         """Save token usage information."""
         try:
             sanitized_name = self.file_handler.sanitize_filename(candidate_name)
-            token_file = self.output_dir / "logs" / f"token_usage_{sanitized_name}.txt"
+            token_file = self._logs_dir / f"token_usage_{sanitized_name}.txt"
             
-            with open(token_file, 'w', encoding='utf-8') as f:
-                f.write(f"Token Usage for {candidate_name}:\n")
-                f.write(f"{token_usage}\n")
+            content = f"Token Usage for {candidate_name}:\n{token_usage}\n"
+            self.writer.submit(token_file, content.encode('utf-8'))
         except Exception as e:
             logger.warning(f"Failed to save token usage for {candidate_name}: {e}")
     
-    def _handle_report_file(self, candidate_name: str) -> str:
+    def _handle_report_file(self, candidate_name: str, work_dir: Path) -> str:
         """Handle moving and renaming the report file."""
         sanitized_name = self.file_handler.sanitize_filename(candidate_name)
-        report_filename = self.output_dir / "reports" / f"report_{sanitized_name}.md"
+        # Candidates can share a name (e.g. several CV.pdf uploads), so key the report
+        # on this analysis' working directory as well
+        report_filename = self._reports_dir / f"report_{sanitized_name}_{work_dir.name}.json"
         
-        # Move report.md to unique filename
-        if os.path.exists('report.md'):
-            if report_filename.exists():
-                report_filename.unlink()
-            os.rename('report.md', report_filename)
+        # Move the crew's report.json to unique filename
+        work_report = work_dir / "report.json"
+        if work_report.exists():
+            os.replace(work_report, report_filename)
         
         return str(report_filename)
     
     def _save_batch_results(self, results: List[Dict], job_title: str) -> None:
         """Save batch analysis results summary."""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            summary_file = self.output_dir / f"batch_analysis_{timestamp}.md"
+            now = datetime.now()
+            summary_file = self.output_dir / f"batch_analysis_{now:%Y%m%d_%H%M%S}.md"
             
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                f.write(f"# Batch Analysis Results - {job_title}\n\n")
-                f.write(f"Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                f.write("## Summary\n\n")
-                f.write(f"Total Candidates Analyzed: {len(results)}\n\n")
-                f.write("## Rankings\n\n")
-                
-                for idx, result in enumerate(results, 1):
-                    score = result.get('score', 0)
-                    recommendation = result.get('recommendation', 'Unknown')
-                    f.write(f"{idx}. **{result['candidate_name']}** - Score: {score:.1f}/10 - {recommendation}\n")
-                
-            logger.info(f"Batch results saved to {summary_file}")
+            header_parts = [
+                f"# Batch Analysis Results - {job_title}\n\n",
+                f"Analysis Date: {now:%Y-%m-%d %H:%M:%S}\n\n",
+                "## Summary\n\n",
+                f"Total Candidates Analyzed: {len(results)}\n\n",
+                "## Rankings\n\n",
+            ]
+            lines = [
+                f"{idx}. **{r['candidate_name']}** - Score: {r.get('score', 0):.1f}/10 - {r.get('recommendation', 'Unknown')}\n"
+                for idx, r in enumerate(results, 1)
+            ]
+            
+            self.writer.submit(summary_file, "".join(header_parts + lines).encode('utf-8'))
+            logger.info(f"Batch results queued for {summary_file}")
         except Exception as e:
             logger.warning(f"Failed to save batch results: {e}")
 
@@ -283,15 +559,19 @@ def run_single_analysis(
         logger.error("Requirements validation failed")
         return {"error": "Missing required environment variables"}
     
-    return engine.analyze_single_resume(
-        resume_path, job_title, job_description, candidate_name
-    )
+    try:
+        return engine.analyze_single_resume(
+            resume_path, job_title, job_description, candidate_name
+        )
+    finally:
+        engine.file_handler.flush_cleanup()
 
 
 def run_batch_analysis(
     resume_files: List[tuple],
     job_title: str,
-    job_description: str
+    job_description: str,
+    barem: Optional[Dict] = None
 ) -> List[Dict[str, Any]]:
     """
     Run batch analysis for multiple resumes.
@@ -300,6 +580,7 @@ def run_batch_analysis(
         resume_files: List of tuples (file_path, candidate_name)
         job_title: Job title for the position
         job_description: Job description text
+        barem: Optional scoring rubric, generated for the job if not given
         
     Returns:
         List of analysis results
@@ -310,7 +591,7 @@ def run_batch_analysis(
         logger.error("Requirements validation failed")
         return []
     
-    return engine.analyze_multiple_resumes(resume_files, job_title, job_description)
+    return engine.analyze_multiple_resumes(resume_files, job_title, job_description, barem=barem)
 
 
 def main():
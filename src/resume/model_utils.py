@@ -2,8 +2,10 @@
 Utility functions for working with Pydantic models and JSON validation.
 """
 
-import json
-from typing import Dict, Any, Union, Type
+import copy
+import orjson
+from functools import lru_cache
+from typing import Dict, Any, Optional, Union, Type
 from pathlib import Path
 import logging
 from pydantic import BaseModel, ValidationError
@@ -38,14 +40,36 @@ class ModelValidator:
         Returns:
             Validated Pydantic model instance or original dict if validation fails
         """
+        model_instance = ModelValidator._validate_raw_json(json_str, model_type)
+        if model_instance is not None:
+            return model_instance
+        
         try:
-            # Parse JSON string
-            data = json.loads(json_str)
+            # Parse JSON string to report the error alongside the original data
+            data = orjson.loads(json_str)
             return ModelValidator.validate_dict(data, model_type)
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON string: {e}")
             return {"error": f"Invalid JSON: {e}"}
     
+    @staticmethod
+    def _validate_raw_json(raw: Union[str, bytes], model_type: str) -> Optional[BaseModel]:
+        """Parse and validate raw JSON in a single pass, returning None if that fails."""
+        model_class = ModelValidator.MODEL_MAPPING.get(model_type)
+        if model_class is None:
+            return None
+        try:
+            model_instance = model_class.model_validate_json(raw)
+        except ValidationError:
+            return None
+        logger.info(f"Successfully validated {model_type} model")
+        return model_instance
+    
+    @staticmethod
+    def is_valid_json(raw: Union[str, bytes], model_type: str) -> bool:
+        """Whether raw JSON (str or bytes) parses and validates against a model type."""
+        return ModelValidator._validate_raw_json(raw, model_type) is not None
+    
     @staticmethod
     def validate_dict(data: Dict[str, Any], model_type: str) -> Union[BaseModel, Dict[str, Any]]:
         """
@@ -66,7 +90,7 @@ class ModelValidator:
         
         try:
             # Create and validate model instance
-            model_instance = model_class(**data)
+            model_instance = model_class.model_validate(data)
             logger.info(f"Successfully validated {model_type} model")
             return model_instance
         except ValidationError as e:
@@ -86,13 +110,19 @@ class ModelValidator:
             Validated Pydantic model instance or error dict
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            
+            model_instance = ModelValidator._validate_raw_json(raw, model_type)
+            if model_instance is not None:
+                return model_instance
+            
+            data = orjson.loads(raw)
             return ModelValidator.validate_dict(data, model_type)
         except FileNotFoundError:
             logger.error(f"File not found: {file_path}")
             return {"error": f"File not found: {file_path}"}
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON in file {file_path}: {e}")
             return {"error": f"Invalid JSON in file: {e}"}
     
@@ -104,7 +134,15 @@ class ModelValidator:
     @staticmethod
     def model_to_json(model: BaseModel, indent: int = 2) -> str:
         """Convert a Pydantic model to a JSON string."""
-        return model.model_dump_json(indent=indent)
+        if indent != 2:
+            # orjson only supports two-space indentation
+            return model.model_dump_json(indent=indent)
+        return ModelValidator._model_to_json_bytes(model).decode('utf-8')
+    
+    @staticmethod
+    def _model_to_json_bytes(model: BaseModel) -> bytes:
+        """Serialize a Pydantic model to indented JSON bytes."""
+        return orjson.dumps(model.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
     
     @staticmethod
     def save_model_to_file(model: BaseModel, file_path: Union[str, Path]) -> bool:
@@ -119,8 +157,8 @@ class ModelValidator:
             True if successful, False otherwise
         """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(ModelValidator.model_to_json(model))
+            with open(file_path, 'wb') as f:
+                f.write(ModelValidator._model_to_json_bytes(model))
             logger.info(f"Successfully saved model to {file_path}")
             return True
         except Exception as e:
@@ -134,28 +172,42 @@ class SchemaDocumentationGenerator:
     @staticmethod
     def generate_field_documentation(model_class: Type[BaseModel]) -> Dict[str, Any]:
         """Generate documentation for all fields in a model."""
+        # The cached documentation is shared, so callers get their own copy
+        return copy.deepcopy(SchemaDocumentationGenerator._field_documentation(model_class))
+    
+    @staticmethod
+    def generate_schema_documentation() -> Dict[str, Any]:
+        """Generate complete documentation for all schemas."""
+        return copy.deepcopy(SchemaDocumentationGenerator._schema_documentation())
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _field_documentation(model_class: Type[BaseModel]) -> Dict[str, Any]:
+        """Field documentation of a model, computed once per model class; must not be mutated."""
         fields_doc = {}
         
         for field_name, field_info in model_class.model_fields.items():
+            default = field_info.get_default(call_default_factory=True)
             fields_doc[field_name] = {
                 "type": str(field_info.annotation),
                 "description": field_info.description or "No description provided",
                 "required": field_info.is_required(),
-                "default": field_info.default if field_info.default is not None else "No default"
+                "default": default if default is not None else "No default"
             }
         
         return fields_doc
     
     @staticmethod
-    def generate_schema_documentation() -> Dict[str, Any]:
-        """Generate complete documentation for all schemas."""
+    @lru_cache(maxsize=None)
+    def _schema_documentation() -> Dict[str, Any]:
+        """Documentation of all schemas, computed once on first use; must not be mutated."""
         documentation = {}
         
         for model_name, model_class in ModelValidator.MODEL_MAPPING.items():
             documentation[model_name] = {
                 "model_class": model_class.__name__,
                 "description": model_class.__doc__ or "No description provided",
-                "fields": SchemaDocumentationGenerator.generate_field_documentation(model_class)
+                "fields": SchemaDocumentationGenerator._field_documentation(model_class)
             }
         
         return documentation
@@ -164,9 +216,10 @@ class SchemaDocumentationGenerator:
     def save_documentation_to_file(file_path: Union[str, Path]) -> bool:
         """Save schema documentation to a JSON file."""
         try:
-            docs = SchemaDocumentationGenerator.generate_schema_documentation()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(docs, f, indent=2, default=str)
+            # Only serialized, so the cached documentation can be used without a copy
+            docs = SchemaDocumentationGenerator._schema_documentation()
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(docs, option=orjson.OPT_INDENT_2, default=str))
             logger.info(f"Documentation saved to {file_path}")
             return True
         except Exception as e:
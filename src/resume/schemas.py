@@ -3,16 +3,113 @@ Pydantic models for Resume Analysis CrewAI project output validation.
 These models enforce the exact structure defined in tasks.yaml.
 """
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Union
+from pydantic.config import ConfigDict
+from pydantic.main import BaseModel
+from pydantic.fields import Field
+from pydantic.functional_validators import BeforeValidator
+from typing import Annotated, List, Literal, Optional, Union
 from enum import Enum
+import re
+
+
+def _vocabulary_key(value: str) -> str:
+    return " ".join(value.lower().replace('_', ' ').replace('-', ' ').split())
+
+
+def _vocabulary(*values: str, fallback: str):
+    """
+    Literal type over a fixed vocabulary that tolerates free-form LLM output.
+    Values are matched ignoring case, spacing and hyphens/underscores (a known
+    term at the start of a longer phrase is also accepted); anything else
+    becomes the fallback value. The canonical value objects are returned, so
+    every instance of a term shares one string.
+    """
+    canonical = {_vocabulary_key(v): v for v in values}
+    # Longest first so a prefix match picks the most specific term
+    prefixes = sorted(canonical.items(), key=lambda item: len(item[0]), reverse=True)
+    
+    def coerce(value):
+        if isinstance(value, str):
+            key = _vocabulary_key(value)
+            if key in canonical:
+                return canonical[key]
+            for term, term_value in prefixes:
+                if key.startswith(term):
+                    return term_value
+        return fallback
+    
+    return Annotated[Literal[values], BeforeValidator(coerce)]
+
+
+_NUMBER_RE = re.compile(r'-?\d+(?:\.\d+)?')
+
+
+def _to_number(value):
+    """Read a score that the LLM may have written as text ("7.5/10", "85%") as a float."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        match = _NUMBER_RE.search(value)
+        return float(match.group(0)) if match else None
+    return value
+
+
+# Numeric score, weight or percentage; None when the LLM didn't give a number ("N/A")
+Score = Annotated[Optional[float], BeforeValidator(_to_number)]
+
+
+def _to_quantity(value):
+    """Read a duration the LLM may have written with units ("5 years", "18 months") as a float."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        match = _NUMBER_RE.search(value)
+        return float(match.group(0)) if match else None
+    return value
+
+
+# Number of years or months; None when the resume doesn't allow it to be determined
+Quantity = Annotated[Optional[float], BeforeValidator(_to_quantity)]
+
+EmploymentType = _vocabulary(
+    "full-time", "part-time", "contract", "internship", "freelance", "other", fallback="other"
+)
+CareerLevel = _vocabulary("entry", "mid", "senior", "executive", "unknown", fallback="unknown")
+CareerProgression = _vocabulary("upward", "lateral", "mixed", "declining", "unknown", fallback="unknown")
+ExperienceMatchLevel = _vocabulary(
+    "exceeds", "meets", "below", "significantly below", "unknown", fallback="unknown"
+)
+EducationMatchLevel = _vocabulary("exceeds", "meets", "below", "not specified", fallback="not specified")
+RecommendationStatus = _vocabulary(
+    "RECOMMENDED", "NOT RECOMMENDED", "CONDITIONALLY RECOMMENDED", "UNKNOWN", fallback="UNKNOWN"
+)
+ConfidenceLevel = _vocabulary("high", "medium", "low", "unknown", fallback="unknown")
+Level = _vocabulary("HIGH", "MEDIUM", "LOW", "UNKNOWN", fallback="UNKNOWN")
+RequirementMatch = _vocabulary(
+    "EXCEEDS", "MEETS", "PARTIALLY MEETS", "DOES NOT MEET", "UNKNOWN", fallback="UNKNOWN"
+)
+PerformanceLevel = _vocabulary(
+    "EXCELLENT", "GOOD", "SATISFACTORY", "NEEDS IMPROVEMENT", "POOR", "UNKNOWN", fallback="UNKNOWN"
+)
+GapCategory = _vocabulary("technical", "experience", "educational", "cultural", "other", fallback="other")
+RiskCategory = _vocabulary("technical", "cultural", "motivational", "capacity", "other", fallback="other")
+
+
+class _SchemaBase(BaseModel):
+    """Common base for the task output models: read-only once validated, unknown keys dropped."""
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        revalidate_instances="never",
+        validate_default=False,
+    )
 
 
 # =============================================================================
 # Document Analysis Task Models
 # =============================================================================
 
-class ContactInformation(BaseModel):
+class ContactInformation(_SchemaBase):
     full_name: str = Field(description="Extracted name or 'Not found'")
     email: str = Field(description="Email address or 'Not found'")
     phone: str = Field(description="Phone number or 'Not found'")
@@ -20,48 +117,48 @@ class ContactInformation(BaseModel):
     github: str = Field(description="GitHub URL or 'Not found'")
     portfolio: str = Field(description="Portfolio URL or 'Not found'")
     address: str = Field(description="Physical address or 'Not found'")
-    other_profiles: List[str] = Field(default=[], description="Array of other social/professional profiles")
+    other_profiles: List[str] = Field(default_factory=list, description="Array of other social/professional profiles")
 
 
-class Education(BaseModel):
+class Education(_SchemaBase):
     degree: str = Field(description="Degree type and field of study")
     institution: str = Field(description="School/university name")
     graduation_date: str = Field(description="Graduation date or expected date")
     gpa: str = Field(description="GPA if mentioned")
     honors: str = Field(description="Honors, distinctions, or awards")
-    relevant_coursework: List[str] = Field(default=[], description="Array of relevant courses")
+    relevant_coursework: List[str] = Field(default_factory=list, description="Array of relevant courses")
     thesis_project: str = Field(description="Thesis or capstone project details")
 
 
-class WorkExperience(BaseModel):
+class WorkExperience(_SchemaBase):
     job_title: str = Field(description="Position title")
     company: str = Field(description="Company name")
     location: str = Field(description="Work location")
     start_date: str = Field(description="Start date")
     end_date: str = Field(description="End date or 'Present'")
-    duration_months: str = Field(description="Calculated duration in months")
-    employment_type: str = Field(description="full-time, part-time, contract, internship, etc.")
-    key_responsibilities: List[str] = Field(default=[], description="Array of main responsibilities")
-    achievements: List[str] = Field(default=[], description="Array of quantified achievements")
-    tools_used: List[str] = Field(default=[], description="Array of tools, technologies, or methods used")
+    duration_months: Quantity = Field(description="Calculated duration in months")
+    employment_type: EmploymentType = Field(description="full-time, part-time, contract, internship, freelance, or other")
+    key_responsibilities: List[str] = Field(default_factory=list, description="Array of main responsibilities")
+    achievements: List[str] = Field(default_factory=list, description="Array of quantified achievements")
+    tools_used: List[str] = Field(default_factory=list, description="Array of tools, technologies, or methods used")
 
 
-class Skills(BaseModel):
-    professional_skills: List[str] = Field(default=[], description="Array of job-specific professional skills")
-    technical_skills: List[str] = Field(default=[], description="Array of technical competencies")
-    software_tools: List[str] = Field(default=[], description="Array of software and tools")
-    methodologies: List[str] = Field(default=[], description="Array of methodologies, frameworks, or approaches")
-    soft_skills: List[str] = Field(default=[], description="Array of interpersonal and soft skills")
-    domain_expertise: List[str] = Field(default=[], description="Array of industry/domain knowledge")
+class Skills(_SchemaBase):
+    professional_skills: List[str] = Field(default_factory=list, description="Array of job-specific professional skills")
+    technical_skills: List[str] = Field(default_factory=list, description="Array of technical competencies")
+    software_tools: List[str] = Field(default_factory=list, description="Array of software and tools")
+    methodologies: List[str] = Field(default_factory=list, description="Array of methodologies, frameworks, or approaches")
+    soft_skills: List[str] = Field(default_factory=list, description="Array of interpersonal and soft skills")
+    domain_expertise: List[str] = Field(default_factory=list, description="Array of industry/domain knowledge")
 
 
-class Language(BaseModel):
+class Language(_SchemaBase):
     language: str = Field(description="Language name")
     proficiency_level: str = Field(description="Proficiency level (A1, A2, B1, B2, C1, C2, Native, Fluent, etc.)")
     certification: str = Field(description="Language certification if any")
 
 
-class Certification(BaseModel):
+class Certification(_SchemaBase):
     name: str = Field(description="Certification name")
     issuer: str = Field(description="Issuing organization")
     date_obtained: str = Field(description="Date obtained")
@@ -70,53 +167,53 @@ class Certification(BaseModel):
     verification_url: str = Field(description="Verification URL if provided")
 
 
-class Project(BaseModel):
+class Project(_SchemaBase):
     name: str = Field(description="Project name")
     description: str = Field(description="Brief description")
-    skills_used: List[str] = Field(default=[], description="Array of skills/tools/technologies used")
+    skills_used: List[str] = Field(default_factory=list, description="Array of skills/tools/technologies used")
     role: str = Field(description="Your role in the project")
     team_size: str = Field(description="Team size if mentioned")
     duration: str = Field(description="Project duration")
     url: str = Field(description="Project URL if available")
-    achievements: List[str] = Field(default=[], description="Array of project outcomes/achievements")
+    achievements: List[str] = Field(default_factory=list, description="Array of project outcomes/achievements")
 
 
-class AdditionalSections(BaseModel):
-    publications: List[str] = Field(default=[], description="Array of publications")
-    patents: List[str] = Field(default=[], description="Array of patents")
-    awards: List[str] = Field(default=[], description="Array of awards and recognition")
-    volunteering: List[str] = Field(default=[], description="Array of volunteer experience")
-    professional_associations: List[str] = Field(default=[], description="Array of memberships")
-    licenses: List[str] = Field(default=[], description="Array of professional licenses")
-    references: List[str] = Field(default=[], description="Array of references or 'Available upon request'")
+class AdditionalSections(_SchemaBase):
+    publications: List[str] = Field(default_factory=list, description="Array of publications")
+    patents: List[str] = Field(default_factory=list, description="Array of patents")
+    awards: List[str] = Field(default_factory=list, description="Array of awards and recognition")
+    volunteering: List[str] = Field(default_factory=list, description="Array of volunteer experience")
+    professional_associations: List[str] = Field(default_factory=list, description="Array of memberships")
+    licenses: List[str] = Field(default_factory=list, description="Array of professional licenses")
+    references: List[str] = Field(default_factory=list, description="Array of references or 'Available upon request'")
 
 
-class EmploymentGap(BaseModel):
+class EmploymentGap(_SchemaBase):
     gap_period: str = Field(description="Period of gap")
-    duration_months: str = Field(description="Gap duration in months")
+    duration_months: Quantity = Field(description="Gap duration in months")
     potential_reason: str = Field(description="Inferred reason if obvious")
 
 
-class AnalysisSummary(BaseModel):
-    total_experience_years: str = Field(description="Calculated total years of experience")
-    total_experience_months: str = Field(description="Calculated total months of experience")
-    career_level: str = Field(description="entry, mid, senior, executive")
+class AnalysisSummary(_SchemaBase):
+    total_experience_years: Quantity = Field(description="Calculated total years of experience")
+    total_experience_months: Quantity = Field(description="Calculated total months of experience")
+    career_level: CareerLevel = Field(description="entry, mid, senior, executive")
     primary_domain: str = Field(description="Main area of expertise")
-    key_strengths: List[str] = Field(default=[], description="Array of top 3-5 strengths")
-    employment_gaps: List[EmploymentGap] = Field(default=[], description="Array of employment gaps")
-    career_progression: str = Field(description="upward, lateral, mixed, declining")
+    key_strengths: List[str] = Field(default_factory=list, description="Array of top 3-5 strengths")
+    employment_gaps: List[EmploymentGap] = Field(default_factory=list, description="Array of employment gaps")
+    career_progression: CareerProgression = Field(description="upward, lateral, mixed, declining")
     most_recent_role: str = Field(description="Most recent job title and company")
 
 
-class DocumentAnalysisOutput(BaseModel):
+class DocumentAnalysisOutput(_SchemaBase):
     """Complete output model for document analysis task"""
     contact_information: ContactInformation
-    education: List[Education] = Field(default=[])
-    work_experience: List[WorkExperience] = Field(default=[])
+    education: List[Education] = Field(default_factory=list)
+    work_experience: List[WorkExperience] = Field(default_factory=list)
     skills: Skills
-    languages: List[Language] = Field(default=[])
-    certifications: List[Certification] = Field(default=[])
-    projects: List[Project] = Field(default=[])
+    languages: List[Language] = Field(default_factory=list)
+    certifications: List[Certification] = Field(default_factory=list)
+    projects: List[Project] = Field(default_factory=list)
     additional_sections: AdditionalSections
     analysis_summary: AnalysisSummary
 
@@ -125,102 +222,102 @@ class DocumentAnalysisOutput(BaseModel):
 # Candidate Matching Task Models
 # =============================================================================
 
-class JobAnalysis(BaseModel):
+class JobAnalysis(_SchemaBase):
     job_title: str = Field(description="Extracted job title")
     job_description: str = Field(description="Full job description provided")
-    critical_requirements: List[str] = Field(default=[], description="Array of must-have requirements from job description")
-    preferred_requirements: List[str] = Field(default=[], description="Array of nice-to-have requirements from job description")
+    critical_requirements: List[str] = Field(default_factory=list, description="Array of must-have requirements from job description")
+    preferred_requirements: List[str] = Field(default_factory=list, description="Array of nice-to-have requirements from job description")
     experience_required: str = Field(description="Years and type of experience specified")
     education_required: str = Field(description="Education requirements if specified")
 
 
-class CandidateOverview(BaseModel):
+class CandidateOverview(_SchemaBase):
     candidate_name: str = Field(description="Candidate name from resume")
     current_title: str = Field(description="Most recent job title")
-    total_experience_years: str = Field(description="Total years of experience")
-    relevant_experience_years: str = Field(description="Years of relevant experience for this role")
+    total_experience_years: Quantity = Field(description="Total years of experience")
+    relevant_experience_years: Quantity = Field(description="Years of relevant experience for this role")
     education_level: str = Field(description="Highest education level")
-    key_skills: List[str] = Field(default=[], description="Array of candidate's key skills relevant to job")
+    key_skills: List[str] = Field(default_factory=list, description="Array of candidate's key skills relevant to job")
 
 
-class RubricEvaluation(BaseModel):
+class RubricEvaluation(_SchemaBase):
     section_name: str = Field(description="Rubric section name")
-    weight_percentage: str = Field(description="Weight from provided rubric")
-    candidate_evidence: List[str] = Field(default=[], description="Array of specific evidence from resume")
-    section_score: str = Field(description="Score based on rubric criteria")
+    weight_percentage: Score = Field(description="Weight from provided rubric")
+    candidate_evidence: List[str] = Field(default_factory=list, description="Array of specific evidence from resume")
+    section_score: Score = Field(description="Score based on rubric criteria")
     score_justification: str = Field(description="Detailed explanation of why this score was assigned")
-    weighted_score: str = Field(description="Calculated weighted score (section_score × weight)")
+    weighted_score: Score = Field(description="Calculated weighted score (section_score × weight)")
 
 
-class SkillsMatch(BaseModel):
-    matched_skills: List[str] = Field(default=[], description="Array of skills candidate has that match job requirements")
-    missing_skills: List[str] = Field(default=[], description="Array of required skills candidate lacks")
-    additional_skills: List[str] = Field(default=[], description="Array of relevant skills candidate has beyond requirements")
-    match_percentage: str = Field(description="Percentage of required skills matched")
+class SkillsMatch(_SchemaBase):
+    matched_skills: List[str] = Field(default_factory=list, description="Array of skills candidate has that match job requirements")
+    missing_skills: List[str] = Field(default_factory=list, description="Array of required skills candidate lacks")
+    additional_skills: List[str] = Field(default_factory=list, description="Array of relevant skills candidate has beyond requirements")
+    match_percentage: Score = Field(description="Percentage of required skills matched")
 
 
-class ExperienceMatch(BaseModel):
+class ExperienceMatch(_SchemaBase):
     required_experience: str = Field(description="Experience requirement from job")
     candidate_experience: str = Field(description="Candidate's relevant experience")
     experience_gap: str = Field(description="Gap analysis if any")
-    match_level: str = Field(description="exceeds, meets, below, or significantly below")
+    match_level: ExperienceMatchLevel = Field(description="exceeds, meets, below, or significantly below")
 
 
-class EducationMatch(BaseModel):
+class EducationMatch(_SchemaBase):
     required_education: str = Field(description="Education requirement from job")
     candidate_education: str = Field(description="Candidate's education")
-    match_level: str = Field(description="exceeds, meets, below, or not specified")
+    match_level: EducationMatchLevel = Field(description="exceeds, meets, below, or not specified")
 
 
-class MatchAnalysis(BaseModel):
+class MatchAnalysis(_SchemaBase):
     skills_match: SkillsMatch
     experience_match: ExperienceMatch
     education_match: EducationMatch
 
 
-class ScoreBreakdown(BaseModel):
+class ScoreBreakdown(_SchemaBase):
     criterion: str = Field(description="Criterion name")
-    raw_score: str = Field(description="Raw score out of 10")
-    weight: str = Field(description="Weight percentage")
-    weighted_points: str = Field(description="raw_score × weight")
+    raw_score: Score = Field(description="Raw score out of 10")
+    weight: Score = Field(description="Weight percentage")
+    weighted_points: Score = Field(description="raw_score × weight")
 
 
-class ScoringSummary(BaseModel):
-    total_weighted_score: str = Field(description="Sum of all weighted scores")
-    normalized_score: str = Field(description="Score out of 10")
-    score_breakdown: List[ScoreBreakdown] = Field(default=[])
+class ScoringSummary(_SchemaBase):
+    total_weighted_score: Score = Field(description="Sum of all weighted scores")
+    normalized_score: Score = Field(description="Score out of 10")
+    score_breakdown: List[ScoreBreakdown] = Field(default_factory=list)
     weights_validation: str = Field(description="Confirmation that weights sum to 100%")
 
 
-class EvaluationResults(BaseModel):
-    critical_missing_requirements: List[str] = Field(default=[], description="Array of critical missing requirements")
-    key_strengths: List[str] = Field(default=[], description="Array of candidate's key strengths for this role")
-    areas_for_improvement: List[str] = Field(default=[], description="Array of areas where candidate could improve")
-    unique_value_propositions: List[str] = Field(default=[], description="Array of unique qualities candidate brings")
-    risk_factors: List[str] = Field(default=[], description="Array of potential concerns or risks")
+class EvaluationResults(_SchemaBase):
+    critical_missing_requirements: List[str] = Field(default_factory=list, description="Array of critical missing requirements")
+    key_strengths: List[str] = Field(default_factory=list, description="Array of candidate's key strengths for this role")
+    areas_for_improvement: List[str] = Field(default_factory=list, description="Array of areas where candidate could improve")
+    unique_value_propositions: List[str] = Field(default_factory=list, description="Array of unique qualities candidate brings")
+    risk_factors: List[str] = Field(default_factory=list, description="Array of potential concerns or risks")
 
 
-class FinalRecommendation(BaseModel):
-    status: str = Field(description="RECOMMENDED | NOT RECOMMENDED | CONDITIONALLY RECOMMENDED")
-    confidence_level: str = Field(description="high, medium, low")
+class FinalRecommendation(_SchemaBase):
+    status: RecommendationStatus = Field(description="RECOMMENDED | NOT RECOMMENDED | CONDITIONALLY RECOMMENDED")
+    confidence_level: ConfidenceLevel = Field(description="high, medium, low")
     primary_reason: str = Field(description="Main reason for recommendation decision")
-    supporting_factors: List[str] = Field(default=[], description="Array of factors supporting the decision")
-    conditions_if_applicable: List[str] = Field(default=[], description="Array of conditions if conditionally recommended")
-    next_steps: List[str] = Field(default=[], description="Array of suggested next steps in hiring process")
+    supporting_factors: List[str] = Field(default_factory=list, description="Array of factors supporting the decision")
+    conditions_if_applicable: List[str] = Field(default_factory=list, description="Array of conditions if conditionally recommended")
+    next_steps: List[str] = Field(default_factory=list, description="Array of suggested next steps in hiring process")
 
 
-class DetailedFeedback(BaseModel):
+class DetailedFeedback(_SchemaBase):
     for_candidate: str = Field(description="Constructive feedback for candidate improvement")
     for_hiring_manager: str = Field(description="Insights and recommendations for hiring manager")
-    interview_focus_areas: List[str] = Field(default=[], description="Array of areas to focus on during interview")
-    reference_check_priorities: List[str] = Field(default=[], description="Array of areas to verify with references")
+    interview_focus_areas: List[str] = Field(default_factory=list, description="Array of areas to focus on during interview")
+    reference_check_priorities: List[str] = Field(default_factory=list, description="Array of areas to verify with references")
 
 
-class CandidateMatchingOutput(BaseModel):
+class CandidateMatchingOutput(_SchemaBase):
     """Complete output model for candidate matching task"""
     job_analysis: JobAnalysis
     candidate_overview: CandidateOverview
-    rubric_evaluation: List[RubricEvaluation] = Field(default=[])
+    rubric_evaluation: List[RubricEvaluation] = Field(default_factory=list)
     match_analysis: MatchAnalysis
     scoring_summary: ScoringSummary
     evaluation_results: EvaluationResults
@@ -232,83 +329,83 @@ class CandidateMatchingOutput(BaseModel):
 # Report Generation Task Models
 # =============================================================================
 
-class ExecutiveSummary(BaseModel):
+class ExecutiveSummary(_SchemaBase):
     candidate_name: str = Field(description="Candidate full name")
     position_applied: str = Field(description="Job title")
     overall_recommendation: str = Field(description="STRONGLY RECOMMENDED | RECOMMENDED | CONDITIONALLY RECOMMENDED | NOT RECOMMENDED")
-    overall_score: str = Field(description="Normalized score out of 10")
-    confidence_level: str = Field(description="HIGH | MEDIUM | LOW")
-    key_decision_factors: List[str] = Field(default=[], description="Array of top 3-5 factors influencing recommendation")
-    critical_concerns: List[str] = Field(default=[], description="Array of major concerns if any")
+    overall_score: Score = Field(description="Normalized score out of 10")
+    confidence_level: Level = Field(description="HIGH | MEDIUM | LOW")
+    key_decision_factors: List[str] = Field(default_factory=list, description="Array of top 3-5 factors influencing recommendation")
+    critical_concerns: List[str] = Field(default_factory=list, description="Array of major concerns if any")
     recommendation_summary: str = Field(description="2-3 sentence summary of final recommendation and rationale")
 
 
-class CandidateProfile(BaseModel):
+class CandidateProfile(_SchemaBase):
     professional_summary: str = Field(description="Comprehensive 3-4 sentence candidate overview")
     career_trajectory: str = Field(description="ascending, stable, transitioning, declining with explanation")
-    total_experience: str = Field(description="Total years of experience")
-    relevant_experience: str = Field(description="Years of directly relevant experience")
+    total_experience: Quantity = Field(description="Total years of experience")
+    relevant_experience: Quantity = Field(description="Years of directly relevant experience")
     education_level: str = Field(description="Highest degree and field")
     current_status: str = Field(description="employed, unemployed, seeking transition")
     geographic_considerations: str = Field(description="Location compatibility assessment")
     career_progression_analysis: str = Field(description="Detailed analysis of career growth pattern")
-    industry_experience: List[str] = Field(default=[], description="Array of industries worked in")
-    company_sizes_worked: List[str] = Field(default=[], description="startup, mid-size, enterprise, etc.")
+    industry_experience: List[str] = Field(default_factory=list, description="Array of industries worked in")
+    company_sizes_worked: List[str] = Field(default_factory=list, description="startup, mid-size, enterprise, etc.")
 
 
-class MustHaveRequirement(BaseModel):
+class MustHaveRequirement(_SchemaBase):
     requirement: str = Field(description="Specific requirement")
-    candidate_match: str = Field(description="EXCEEDS | MEETS | PARTIALLY MEETS | DOES NOT MEET")
+    candidate_match: RequirementMatch = Field(description="EXCEEDS | MEETS | PARTIALLY MEETS | DOES NOT MEET")
     evidence: str = Field(description="Specific evidence from resume")
     gap_analysis: str = Field(description="Description of any gaps")
-    risk_level: str = Field(description="HIGH | MEDIUM | LOW")
+    risk_level: Level = Field(description="HIGH | MEDIUM | LOW")
     impact_on_role_success: str = Field(description="How this requirement affects job performance")
 
 
-class PreferredRequirement(BaseModel):
+class PreferredRequirement(_SchemaBase):
     requirement: str = Field(description="Specific requirement")
-    candidate_match: str = Field(description="EXCEEDS | MEETS | PARTIALLY MEETS | DOES NOT MEET")
+    candidate_match: RequirementMatch = Field(description="EXCEEDS | MEETS | PARTIALLY MEETS | DOES NOT MEET")
     evidence: str = Field(description="Specific evidence from resume")
     added_value: str = Field(description="Description of additional value if met")
 
 
-class JobRequirementsAnalysis(BaseModel):
-    must_have_requirements: List[MustHaveRequirement] = Field(default=[])
-    preferred_requirements: List[PreferredRequirement] = Field(default=[])
-    requirements_satisfaction_score: str = Field(description="Percentage of requirements met")
-    critical_missing_requirements: List[str] = Field(default=[], description="Array of missing must-have requirements")
-    exceeds_expectations_in: List[str] = Field(default=[], description="Array of areas where candidate exceeds requirements")
+class JobRequirementsAnalysis(_SchemaBase):
+    must_have_requirements: List[MustHaveRequirement] = Field(default_factory=list)
+    preferred_requirements: List[PreferredRequirement] = Field(default_factory=list)
+    requirements_satisfaction_score: Score = Field(description="Percentage of requirements met")
+    critical_missing_requirements: List[str] = Field(default_factory=list, description="Array of missing must-have requirements")
+    exceeds_expectations_in: List[str] = Field(default_factory=list, description="Array of areas where candidate exceeds requirements")
 
 
-class RubricBreakdown(BaseModel):
+class RubricBreakdown(_SchemaBase):
     criterion: str = Field(description="Criterion name")
-    raw_score: str = Field(description="Score out of 10")
-    weight_percentage: str = Field(description="Weight in evaluation")
-    weighted_points: str = Field(description="Calculated weighted points")
-    performance_level: str = Field(description="EXCELLENT | GOOD | SATISFACTORY | NEEDS IMPROVEMENT | POOR")
-    supporting_evidence: List[str] = Field(default=[], description="Array of specific evidence")
+    raw_score: Score = Field(description="Score out of 10")
+    weight_percentage: Score = Field(description="Weight in evaluation")
+    weighted_points: Score = Field(description="Calculated weighted points")
+    performance_level: PerformanceLevel = Field(description="EXCELLENT | GOOD | SATISFACTORY | NEEDS IMPROVEMENT | POOR")
+    supporting_evidence: List[str] = Field(default_factory=list, description="Array of specific evidence")
     score_justification: str = Field(description="Detailed explanation of score assignment")
     benchmark_comparison: str = Field(description="How this compares to typical candidates")
 
 
-class ScoreDistribution(BaseModel):
-    technical_skills: str = Field(description="Weighted score for technical competencies")
-    experience_relevance: str = Field(description="Weighted score for experience match")
-    educational_background: str = Field(description="Weighted score for education match")
-    achievements_impact: str = Field(description="Weighted score for demonstrated achievements")
-    skill_depth_breadth: str = Field(description="Weighted score for skill comprehensiveness")
+class ScoreDistribution(_SchemaBase):
+    technical_skills: Score = Field(description="Weighted score for technical competencies")
+    experience_relevance: Score = Field(description="Weighted score for experience match")
+    educational_background: Score = Field(description="Weighted score for education match")
+    achievements_impact: Score = Field(description="Weighted score for demonstrated achievements")
+    skill_depth_breadth: Score = Field(description="Weighted score for skill comprehensiveness")
 
 
-class DetailedScoringAnalysis(BaseModel):
-    rubric_breakdown: List[RubricBreakdown] = Field(default=[])
+class DetailedScoringAnalysis(_SchemaBase):
+    rubric_breakdown: List[RubricBreakdown] = Field(default_factory=list)
     scoring_methodology: str = Field(description="Explanation of how scores were calculated")
     score_distribution: ScoreDistribution
-    total_weighted_score: str = Field(description="Final calculated score")
+    total_weighted_score: Score = Field(description="Final calculated score")
     percentile_ranking: str = Field(description="Estimated percentile vs typical candidates for this role")
     score_reliability: str = Field(description="Confidence in scoring accuracy")
 
 
-class CoreStrength(BaseModel):
+class CoreStrength(_SchemaBase):
     strength: str = Field(description="Specific strength")
     evidence: str = Field(description="Supporting evidence from resume")
     business_impact: str = Field(description="How this strength benefits the role/company")
@@ -316,14 +413,14 @@ class CoreStrength(BaseModel):
     quantified_impact: str = Field(description="Measurable outcomes if available")
 
 
-class UniqueValueProposition(BaseModel):
+class UniqueValueProposition(_SchemaBase):
     value_proposition: str = Field(description="Unique aspect candidate brings")
     market_advantage: str = Field(description="Competitive advantage this provides")
     differentiation_level: str = Field(description="How this sets candidate apart")
     strategic_value: str = Field(description="Long-term strategic benefit to organization")
 
 
-class StandoutAchievement(BaseModel):
+class StandoutAchievement(_SchemaBase):
     achievement: str = Field(description="Specific achievement")
     quantified_impact: str = Field(description="Measurable impact if available")
     relevance_to_role: str = Field(description="How this achievement applies to target role")
@@ -331,75 +428,75 @@ class StandoutAchievement(BaseModel):
     complexity_level: str = Field(description="Sophistication of the achievement")
 
 
-class StrengthsAndDifferentiators(BaseModel):
-    core_strengths: List[CoreStrength] = Field(default=[])
-    unique_value_propositions: List[UniqueValueProposition] = Field(default=[])
-    standout_achievements: List[StandoutAchievement] = Field(default=[])
-    leadership_indicators: List[str] = Field(default=[], description="Array of leadership qualities demonstrated")
-    innovation_examples: List[str] = Field(default=[], description="Array of innovative contributions or thinking")
+class StrengthsAndDifferentiators(_SchemaBase):
+    core_strengths: List[CoreStrength] = Field(default_factory=list)
+    unique_value_propositions: List[UniqueValueProposition] = Field(default_factory=list)
+    standout_achievements: List[StandoutAchievement] = Field(default_factory=list)
+    leadership_indicators: List[str] = Field(default_factory=list, description="Array of leadership qualities demonstrated")
+    innovation_examples: List[str] = Field(default_factory=list, description="Array of innovative contributions or thinking")
 
 
-class CriticalGap(BaseModel):
+class CriticalGap(_SchemaBase):
     gap: str = Field(description="Specific missing requirement")
-    impact_level: str = Field(description="HIGH | MEDIUM | LOW")
+    impact_level: Level = Field(description="HIGH | MEDIUM | LOW")
     severity_assessment: str = Field(description="How critical this gap is to role success")
     likelihood_of_success_despite_gap: str = Field(description="Assessment of success probability")
-    gap_category: str = Field(description="technical, experience, educational, cultural")
+    gap_category: GapCategory = Field(description="technical, experience, educational, cultural")
 
 
-class ExperienceGap(BaseModel):
+class ExperienceGap(_SchemaBase):
     gap_area: str = Field(description="Specific experience missing")
     years_of_experience_gap: str = Field(description="Quantified experience shortfall")
     complexity_gap: str = Field(description="Sophistication level missing")
     industry_specific_concerns: str = Field(description="Industry-specific experience gaps")
 
 
-class SkillDeficiency(BaseModel):
+class SkillDeficiency(_SchemaBase):
     skill: str = Field(description="Specific skill gap")
     proficiency_gap: str = Field(description="Level of proficiency missing")
     criticality_to_role: str = Field(description="How essential this skill is")
     market_availability: str = Field(description="How common this skill is in market")
 
 
-class PerformanceRiskFactor(BaseModel):
+class PerformanceRiskFactor(_SchemaBase):
     risk_factor: str = Field(description="Specific risk")
     probability: str = Field(description="Likelihood this risk manifests")
     impact: str = Field(description="Potential impact on performance")
-    risk_category: str = Field(description="technical, cultural, motivational, capacity")
+    risk_category: RiskCategory = Field(description="technical, cultural, motivational, capacity")
 
 
-class CulturalFitAssessment(BaseModel):
-    cultural_alignment_score: str = Field(description="Score out of 10")
-    cultural_strengths: List[str] = Field(default=[], description="Array of cultural fit strengths")
-    cultural_concerns: List[str] = Field(default=[], description="Array of potential cultural misalignment")
+class CulturalFitAssessment(_SchemaBase):
+    cultural_alignment_score: Score = Field(description="Score out of 10")
+    cultural_strengths: List[str] = Field(default_factory=list, description="Array of cultural fit strengths")
+    cultural_concerns: List[str] = Field(default_factory=list, description="Array of potential cultural misalignment")
     team_integration_assessment: str = Field(description="Likelihood of successful team integration")
 
 
-class GapsAndRiskAssessment(BaseModel):
-    critical_gaps: List[CriticalGap] = Field(default=[])
-    experience_gaps: List[ExperienceGap] = Field(default=[])
-    skill_deficiencies: List[SkillDeficiency] = Field(default=[])
-    performance_risk_factors: List[PerformanceRiskFactor] = Field(default=[])
+class GapsAndRiskAssessment(_SchemaBase):
+    critical_gaps: List[CriticalGap] = Field(default_factory=list)
+    experience_gaps: List[ExperienceGap] = Field(default_factory=list)
+    skill_deficiencies: List[SkillDeficiency] = Field(default_factory=list)
+    performance_risk_factors: List[PerformanceRiskFactor] = Field(default_factory=list)
     cultural_fit_assessment: CulturalFitAssessment
 
 
-class ComparativeAnalysis(BaseModel):
+class ComparativeAnalysis(_SchemaBase):
     market_positioning: str = Field(description="How candidate compares to typical market candidates")
     salary_market_alignment: str = Field(description="Alignment with market compensation")
     competitive_advantage: str = Field(description="What makes this candidate stand out")
     alternative_candidates_consideration: str = Field(description="How this candidate compares to alternatives")
     urgency_vs_quality_tradeoff: str = Field(description="Assessment of hiring urgency vs candidate quality")
-    market_scarcity_factors: List[str] = Field(default=[], description="Array of factors affecting candidate availability")
+    market_scarcity_factors: List[str] = Field(default_factory=list, description="Array of factors affecting candidate availability")
 
 
-class CostBenefitAnalysis(BaseModel):
+class CostBenefitAnalysis(_SchemaBase):
     total_cost_of_hire: str = Field(description="Estimated total hiring cost")
     expected_productivity_value: str = Field(description="Estimated value creation")
     roi_timeline: str = Field(description="Expected timeline for positive ROI")
     investment_risk_level: str = Field(description="Risk level of hiring investment")
 
 
-class BusinessImpactAssessment(BaseModel):
+class BusinessImpactAssessment(_SchemaBase):
     immediate_impact_potential: str = Field(description="Ability to contribute immediately")
     ramp_up_time_estimate: str = Field(description="Estimated time to full productivity")
     long_term_value_creation: str = Field(description="Potential for long-term value creation")
@@ -408,23 +505,23 @@ class BusinessImpactAssessment(BaseModel):
     cost_benefit_analysis: CostBenefitAnalysis
 
 
-class AlternativeScenario(BaseModel):
+class AlternativeScenario(_SchemaBase):
     scenario: str = Field(description="Alternative outcome scenario")
     probability: str = Field(description="Likelihood of this scenario")
     implications: str = Field(description="What this scenario would mean")
 
 
-class DecisionRationale(BaseModel):
-    primary_reasons_for_recommendation: List[str] = Field(default=[], description="Array of main reasons supporting recommendation")
-    primary_reasons_against_recommendation: List[str] = Field(default=[], description="Array of main concerns")
-    decision_confidence_factors: List[str] = Field(default=[], description="Array of factors supporting confidence level")
-    decision_uncertainty_factors: List[str] = Field(default=[], description="Array of factors creating uncertainty")
-    alternative_scenarios: List[AlternativeScenario] = Field(default=[])
-    key_assumptions: List[str] = Field(default=[], description="Array of assumptions underlying the recommendation")
+class DecisionRationale(_SchemaBase):
+    primary_reasons_for_recommendation: List[str] = Field(default_factory=list, description="Array of main reasons supporting recommendation")
+    primary_reasons_against_recommendation: List[str] = Field(default_factory=list, description="Array of main concerns")
+    decision_confidence_factors: List[str] = Field(default_factory=list, description="Array of factors supporting confidence level")
+    decision_uncertainty_factors: List[str] = Field(default_factory=list, description="Array of factors creating uncertainty")
+    alternative_scenarios: List[AlternativeScenario] = Field(default_factory=list)
+    key_assumptions: List[str] = Field(default_factory=list, description="Array of assumptions underlying the recommendation")
     sensitivity_analysis: str = Field(description="How sensitive the recommendation is to key factors")
 
 
-class StakeholderImpactAnalysis(BaseModel):
+class StakeholderImpactAnalysis(_SchemaBase):
     hiring_manager_considerations: str = Field(description="Specific points for hiring manager")
     team_impact_assessment: str = Field(description="How this hire affects the team")
     departmental_implications: str = Field(description="Broader departmental considerations")
@@ -433,16 +530,16 @@ class StakeholderImpactAnalysis(BaseModel):
     timeline_considerations: str = Field(description="Timing factors affecting the hire")
 
 
-class QualityAssurance(BaseModel):
+class QualityAssurance(_SchemaBase):
     data_completeness_assessment: str = Field(description="Assessment of data quality used")
     evaluation_methodology_validation: str = Field(description="Validation of evaluation approach")
-    potential_bias_factors: List[str] = Field(default=[], description="Array of potential biases identified")
+    potential_bias_factors: List[str] = Field(default_factory=list, description="Array of potential biases identified")
     confidence_intervals: str = Field(description="Uncertainty ranges for key assessments")
     recommendation_robustness: str = Field(description="How robust the recommendation is to new information")
-    evaluation_limitations: List[str] = Field(default=[], description="Array of limitations in the evaluation")
+    evaluation_limitations: List[str] = Field(default_factory=list, description="Array of limitations in the evaluation")
 
 
-class ReportGenerationOutput(BaseModel):
+class ReportGenerationOutput(_SchemaBase):
     """Complete output model for report generation task"""
     executive_summary: ExecutiveSummary
     candidate_profile: CandidateProfile
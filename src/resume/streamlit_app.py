@@ -5,15 +5,17 @@ This file contains only UI logic, with business logic handled by main.py
 """
 
 import streamlit as st
-import tempfile
 import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-import pandas as pd
 from typing import List, Dict, Any
 
 # Import the main analysis engine
-from main import ResumeAnalysisEngine, run_batch_analysis
-from utils.file_handler import FileHandler
+from main import ResumeAnalysisEngine
+from utils.barem_generator import BaremGenerator
+from utils.report_parser import ReportParser
 
 # Configure Streamlit page
 st.set_page_config(
@@ -24,7 +26,7 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
+_CSS = """
 <style>
     .stButton>button {
         background-color: #4CAF50;
@@ -89,7 +91,7 @@ st.markdown("""
         margin: 0.25rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 # Place these helper functions at the top of the file (after imports) so they are always defined before use
 import re
@@ -108,14 +110,115 @@ def extract_recommendation_from_markdown(md):
     return "Unknown"
 
 
+# Score buckets indexed by how many thresholds (6.0, 8.0) the score reaches
+_SCORE_CLASSES = ("score-low", "score-medium", "score-high")
+
+_CONFIDENCE_CLASSES = {
+    "high": "confidence-high",
+    "medium": "confidence-medium",
+}
+
+
+@lru_cache(maxsize=256)
+def _recommendation_class(recommendation: str) -> str:
+    """CSS class for a recommendation; the set of distinct recommendations is small, so it's cached."""
+    recommendation_lower = recommendation.lower()
+    if "strongly recommended" in recommendation_lower:
+        return "recommendation-strong"
+    elif "recommended" in recommendation_lower and "not" not in recommendation_lower:
+        return "recommendation-recommended"
+    elif "conditional" in recommendation_lower:
+        return "recommendation-conditional"
+    else:
+        return "recommendation-not"
+
+
+@dataclass(slots=True)
+class NormalizedResult:
+    """Display fields of one analysis result, resolved once after the analysis."""
+    candidate: str
+    score: float
+    recommendation: str
+    confidence: str
+    valid: bool
+    strengths: List[str] = field(default_factory=list)
+    gaps: List[str] = field(default_factory=list)
+    report: str = ''
+    report_path: str = ''
+    error: str = 'Unknown error'
+    
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "NormalizedResult":
+        """Normalize a result dict from the analysis engine, falling back to the markdown report."""
+        # Results cached before the report JSON moved under 'raw' have it at the top level
+        report_data = result.get('raw', result)
+        executive_summary = report_data.get('executive_summary', {})
+        score_raw = executive_summary.get('overall_score')
+        if score_raw is None:
+            # Missing, or written as something other than a number ("N/A")
+            score_raw = result.get('score') or 0
+        if isinstance(score_raw, str):
+            match = re.match(r'([\d\.]+)', score_raw)
+            score = float(match.group(1)) if match else 0.0
+        else:
+            score = float(score_raw)
+        recommendation = executive_summary.get('overall_recommendation', result.get('recommendation', 'Unknown'))
+        if isinstance(recommendation, (list, dict)):
+            recommendation = str(recommendation)
+        # Results cached before reports were loaded on demand still carry the text
+        report_content = result.get('report_content') or ''
+        # Fallback: extract from markdown if missing, reading the report only then
+        needs_score = not score or score == 0
+        needs_recommendation = not recommendation or recommendation == 'Unknown'
+        if (needs_score or needs_recommendation) and not report_content:
+            report_content = ReportParser.get_report_content(result.get('report_path'))
+        if needs_score and report_content:
+            score = extract_score_from_markdown(report_content)
+        if needs_recommendation and report_content:
+            recommendation = extract_recommendation_from_markdown(report_content)
+        return cls(
+            candidate=result.get('candidate_name', 'Unknown'),
+            score=score,
+            recommendation=recommendation,
+            confidence=executive_summary.get('confidence_level', 'Unknown'),
+            valid=result.get('valid', True),
+            strengths=result.get('strengths', []),
+            gaps=result.get('gaps', []),
+            report=report_content,
+            report_path=result.get('report_path', ''),
+            error=result.get('error', 'Unknown error')
+        )
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 3600)
+def get_barem_cached(job_title: str, job_description: str) -> dict:
+    """Get the barem for a job, memoized per (job_title, job_description) across reruns."""
+    # The generator's disk cache stays as a second tier shared between sessions
+    barem = BaremGenerator(Path("output")).get_barem(job_title, job_description)
+    if not barem:
+        # Raise rather than return so a failed generation is not cached
+        raise ValueError(f"No barem could be generated for '{job_title}'")
+    return barem
+
+
+@st.cache_resource
+def _get_engine() -> ResumeAnalysisEngine:
+    """Analysis engine shared by every rerun and session of the app."""
+    return ResumeAnalysisEngine()
+
+
 class StreamlitApp:
     """Main Streamlit application for resume analysis."""
     
     def __init__(self):
-        self.file_handler = FileHandler(Path("output"))
+        self.file_handler = _get_engine().file_handler
         
     def run(self):
         """Run the Streamlit application."""
+        # Streamlit drops elements that a rerun doesn't emit again, so the styles are
+        # re-sent on every run; the string itself is built once at import
+        st.markdown(_CSS, unsafe_allow_html=True)
+        
         # Header
         st.markdown('<h1 style="color:#4CAF50;">VEO</h1>', unsafe_allow_html=True)
         st.title("🤖 AI Resume Analyzer")
@@ -220,6 +323,10 @@ class StreamlitApp:
         # Analysis button
         if st.button("🚀 Start Analysis", type="primary"):
             self._run_analysis(resume_files, job_title, job_description)
+        
+        # Results are kept in session state so inspecting a candidate doesn't discard them
+        if 'home_results' in st.session_state:
+            self._display_results(st.session_state.home_results, key="home")
     
     def _render_hr_page(self):
         """Render the HR dashboard page."""
@@ -245,6 +352,7 @@ class StreamlitApp:
         
         if 'recent_analyses' in st.session_state and st.session_state.recent_analyses:
             # Display recent analyses in a table
+            import pandas as pd  # Imported on use to keep app start-up fast
             df = pd.DataFrame(st.session_state.recent_analyses)
             st.dataframe(df, use_container_width=True)
         else:
@@ -280,6 +388,9 @@ class StreamlitApp:
                         self._run_batch_analysis(batch_files, batch_job_title, batch_job_description)
                     else:
                         st.error("Please provide job title and description for batch analysis.")
+        
+        if 'batch_results' in st.session_state:
+            self._display_results(st.session_state.batch_results, key="batch")
     
     def _render_about_page(self):
         """Render the about page with system information."""
@@ -373,85 +484,90 @@ class StreamlitApp:
         status_text = st.empty()
         
         try:
-            # Initialize analysis engine
-            engine = ResumeAnalysisEngine()
+            # Get the shared analysis engine
+            engine = _get_engine()
             
             if not engine.validate_requirements():
                 st.error("System requirements not met. Please check environment variables.")
                 return
             
-            # Prepare file list for batch processing
-            resume_file_list = []
-            total_files = len(resume_files)
-            
-            for i, uploaded_file in enumerate(resume_files):
-                # Create temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                    tmp_file.write(uploaded_file.getbuffer())
-                    candidate_name = Path(uploaded_file.name).stem
-                    resume_file_list.append((tmp_file.name, candidate_name))
-            
-            # Update initial status
-            status_text.text("Starting analysis...")
-            
-            # Run batch analysis
-            results = engine.analyze_multiple_resumes(
-                resume_file_list, 
-                job_title, 
-                job_description,
-                progress_callback=lambda idx, total, candidate: self._update_progress(progress_bar, status_text, idx, total, candidate)
-            )
+            # Create temporary files, removed again when the block exits
+            with self.file_handler.staged_uploads(resume_files) as resume_file_list:
+                total_files = len(resume_file_list)
+                
+                status_text.text("Preparing scoring rubric...")
+                barem = get_barem_cached(job_title, job_description)
+                
+                # Update initial status
+                status_text.text(f"Analyzing {total_files} resume(s) in parallel...")
+                
+                # Show each report as soon as its analysis finishes, while the rest are still running
+                live_results = st.empty()
+                live_container = live_results.container()
+                
+                # Run batch analysis; the engine analyzes resumes on a worker pool and
+                # invokes the callbacks on this thread as each one finishes
+                results = engine.analyze_multiple_resumes(
+                    resume_file_list, 
+                    job_title, 
+                    job_description,
+                    progress_callback=lambda idx, total, candidate: self._update_progress(progress_bar, status_text, idx, total, candidate),
+                    barem=barem,
+                    result_callback=lambda idx, result: self._render_live_result(live_container, idx, result)
+                )
             
             # Complete progress
             progress_bar.progress(1.0)
             status_text.text("Analysis complete!")
             
-            # Display results
-            self._display_results(results)
+            # Replace the completion-ordered reports with the ranked results below
+            live_results.empty()
+            
+            # Keep results for display on this and later reruns
+            results = [NormalizedResult.from_result(result) for result in results]
+            st.session_state.home_results = results
             
             # Update session state
             self._update_session_state(results)
             
         except Exception as e:
             st.error(f"Analysis failed: {str(e)}")
-        finally:
-            # Clean up temporary files
-            for file_path, _ in resume_file_list:
-                try:
-                    os.unlink(file_path)
-                except:
-                    pass
     
     def _run_batch_analysis(self, batch_files, job_title, job_description):
         """Run batch analysis for multiple resumes."""
-        # Convert uploaded files to format expected by run_batch_analysis
-        resume_file_list = []
-        
-        for uploaded_file in batch_files:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                tmp_file.write(uploaded_file.getbuffer())
-                candidate_name = Path(uploaded_file.name).stem
-                resume_file_list.append((tmp_file.name, candidate_name))
-        
-        # Run batch analysis
-        with st.spinner("Running batch analysis..."):
-            results = run_batch_analysis(resume_file_list, job_title, job_description)
+        # Convert uploaded files to format expected by analyze_multiple_resumes
+        with self.file_handler.staged_uploads(batch_files) as resume_file_list:
+            # Run batch analysis
+            with st.spinner("Running batch analysis..."):
+                try:
+                    barem = get_barem_cached(job_title, job_description)
+                except ValueError as e:
+                    st.error(str(e))
+                    barem = None
+                engine = _get_engine()
+                if not barem:
+                    results = []
+                elif not engine.validate_requirements():
+                    st.error("System requirements not met. Please check environment variables.")
+                    results = []
+                else:
+                    results = engine.analyze_multiple_resumes(
+                        resume_file_list, job_title, job_description, barem=barem
+                    )
         
-        # Display results
-        self._display_results(results)
+        # Keep results for display on this and later reruns
+        results = [NormalizedResult.from_result(result) for result in results]
+        st.session_state.batch_results = results
         
         # Update session state
         self._update_session_state(results)
-        
-        # Clean up temporary files
-        for file_path, _ in resume_file_list:
-            try:
-                os.unlink(file_path)
-            except:
-                pass
     
-    def _display_results(self, results):
-        """Display analysis results in a formatted way using the new JSON structure."""
+    @st.fragment
+    def _display_results(self, results, key="results"):
+        """
+        Display analysis results in a formatted way using the new JSON structure.
+        Runs as a fragment, so picking another candidate reruns only this section.
+        """
         if not results:
             st.warning("No results to display.")
             return
@@ -462,87 +578,72 @@ class StreamlitApp:
         st.subheader("📊 Results Summary")
         
         # Create results dataframe
-        df_data = []
+        candidates, scores, recommendations, confidences, statuses = [], [], [], [], []
         for result in results:
-            executive_summary = result.get('executive_summary', {})
-            candidate_profile = result.get('candidate_profile', {})
-            score_raw = executive_summary.get('overall_score', result.get('score', 0))
-            if isinstance(score_raw, str):
-                match = re.match(r'([\d\.]+)', score_raw)
-                score = float(match.group(1)) if match else 0.0
-            else:
-                score = float(score_raw)
-            recommendation = executive_summary.get('overall_recommendation', result.get('recommendation', 'Unknown'))
-            if isinstance(recommendation, (list, dict)):
-                recommendation = str(recommendation)
-            # Fallback: extract from markdown if missing
-            if (not score or score == 0) and result.get('report_content'):
-                score = extract_score_from_markdown(result['report_content'])
-            if (not recommendation or recommendation == 'Unknown') and result.get('report_content'):
-                recommendation = extract_recommendation_from_markdown(result['report_content'])
-            confidence = executive_summary.get('confidence_level', 'Unknown')
-            df_data.append({
-                'Candidate': result.get('candidate_name', 'Unknown'),
-                'Score': f"{score:.1f}/10",
-                'Recommendation': recommendation,
-                'Confidence': confidence,
-                'Experience': 'Unknown',
-                'Status': '✅ Success' if result.get('valid', True) else '❌ Failed'
-            })
-        
-        df = pd.DataFrame(df_data)
+            candidates.append(result.candidate)
+            scores.append(f"{result.score:.1f}/10")
+            recommendations.append(result.recommendation)
+            confidences.append(result.confidence)
+            statuses.append('✅ Success' if result.valid else '❌ Failed')
+        
+        # Build the frame column-wise so pandas infers each dtype once
+        import pandas as pd  # Imported on use to keep app start-up fast
+        df = pd.DataFrame({
+            'Candidate': candidates,
+            'Score': scores,
+            'Recommendation': recommendations,
+            'Confidence': confidences,
+            'Experience': ['Unknown'] * len(results),
+            'Status': statuses
+        })
         st.dataframe(df, use_container_width=True)
         
-        # Detailed results
+        # Detailed results; only the inspected candidate's report is rendered on each rerun
         st.subheader("📋 Detailed Results")
-        for i, result in enumerate(results, 1):
-            candidate_name = result.get('candidate_name', 'Unknown')
-            executive_summary = result.get('executive_summary', {})
-            score_raw = executive_summary.get('overall_score', result.get('score', 0))
-            if isinstance(score_raw, str):
-                match = re.match(r'([\d\.]+)', score_raw)
-                score = float(match.group(1)) if match else 0.0
-            else:
-                score = float(score_raw)
-            recommendation = executive_summary.get('overall_recommendation', result.get('recommendation', 'Unknown'))
-            if isinstance(recommendation, (list, dict)):
-                recommendation = str(recommendation)
-            # Fallback: extract from markdown if missing
-            if (not score or score == 0) and result.get('report_content'):
-                score = extract_score_from_markdown(result['report_content'])
-            if (not recommendation or recommendation == 'Unknown') and result.get('report_content'):
-                recommendation = extract_recommendation_from_markdown(result['report_content'])
-            strengths = result.get('strengths', [])
-            gaps = result.get('gaps', [])
-            report_content = result.get('report_content', '')
-
-            with st.expander(f"#{i}: {candidate_name} - {score:.1f}/10"):
-                if result.get('valid', True):
-                    st.markdown("### 🎯 Executive Summary")
-                    st.markdown(f"**Overall Score:** {score:.1f}/10")
-                    st.markdown(f"**Recommendation:** {recommendation}")
+        labels = [f"#{i}: {result.candidate}" for i, result in enumerate(results, 1)]
+        selected = st.selectbox(
+            "Inspect candidate",
+            range(len(results)),
+            format_func=labels.__getitem__,
+            key=f"{key}_inspect"
+        )
+        self._display_single_result(selected + 1, results[selected], expanded=True)
+    
+    def _display_single_result(self, i, result, expanded=False):
+        """Display the detailed report of one candidate in an expander."""
+        with st.expander(f"#{i}: {result.candidate} - {result.score:.1f}/10", expanded=expanded):
+            if result.valid:
+                st.markdown("### 🎯 Executive Summary")
+                st.markdown(f"**Overall Score:** {result.score:.1f}/10")
+                st.markdown(f"**Recommendation:** {result.recommendation}")
 
-                    st.markdown("### ✅ Strengths and Differentiators")
-                    if strengths:
-                        for strength in strengths:
-                            st.markdown(f"- {strength}")
-                    else:
-                        st.markdown("No strengths found.")
+                st.markdown("### ✅ Strengths and Differentiators")
+                if result.strengths:
+                    for strength in result.strengths:
+                        st.markdown(f"- {strength}")
+                else:
+                    st.markdown("No strengths found.")
 
-                    st.markdown("### ❌ Gaps and Risk Assessment")
-                    if gaps:
-                        for gap in gaps:
-                            st.markdown(f"- {gap}")
-                    else:
-                        st.markdown("No gaps found.")
+                st.markdown("### ❌ Gaps and Risk Assessment")
+                if result.gaps:
+                    for gap in result.gaps:
+                        st.markdown(f"- {gap}")
+                else:
+                    st.markdown("No gaps found.")
 
-                    st.markdown("### 📄 Full Report")
-                    if report_content:
-                        st.markdown(report_content)
-                    else:
-                        st.markdown("No report content available.")
+                st.markdown("### 📄 Full Report")
+                report = result.report or ReportParser.get_report_content(result.report_path)
+                if report:
+                    st.markdown(report)
                 else:
-                    st.error(f"Analysis failed: {result.get('error', 'Unknown error')}")
+                    st.markdown("No report content available.")
+            else:
+                st.error(f"Analysis failed: {result.error}")
+    
+    def _render_live_result(self, container, idx, result):
+        """Render a freshly completed analysis into the live results container."""
+        with container:
+            self._display_single_result(idx + 1, NormalizedResult.from_result(result))
     
     def _update_session_state(self, results):
         """Update session state with analysis results using the new JSON structure."""
@@ -550,7 +651,7 @@ class StreamlitApp:
             return
         
         # Update metrics
-        valid_results = [r for r in results if r.get('valid', True)]
+        valid_results = [r for r in results if r.valid]
         
         st.session_state.total_analyses = st.session_state.get('total_analyses', 0) + len(results)
         st.session_state.success_rate = (len(valid_results) / len(results)) * 100 if results else 0
@@ -559,70 +660,49 @@ class StreamlitApp:
         total_score = 0
         score_count = 0
         for result in valid_results:
-            executive_summary = result.get('executive_summary', {})
-            score = executive_summary.get('overall_score', 0)
-            if score > 0:
-                total_score += score
+            if result.score > 0:
+                total_score += result.score
                 score_count += 1
         
         st.session_state.avg_score = total_score / score_count if score_count > 0 else 0
-        st.session_state.last_analysis = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')
+        st.session_state.last_analysis = datetime.now().strftime('%Y-%m-%d %H:%M')
         
-        # Update recent analyses
+        # Update recent analyses; only the last 10 are kept, so older results are skipped
         recent_analyses = st.session_state.get('recent_analyses', [])
+        analysis_date = st.session_state.last_analysis
         
-        for result in results:
-            executive_summary = result.get('executive_summary', {})
-            
+        for result in results[-10:]:
             recent_analyses.append({
-                'Date': pd.Timestamp.now().strftime('%Y-%m-%d %H:%M'),
-                'Candidate': executive_summary.get('candidate_name', 'Unknown'),
-                'Score': f"{executive_summary.get('overall_score', 0):.1f}/10",
-                'Recommendation': executive_summary.get('overall_recommendation', 'Unknown'),
-                'Confidence': executive_summary.get('confidence_level', 'Unknown'),
-                'Status': '✅ Success' if result.get('valid', True) else '❌ Failed'
+                'Date': analysis_date,
+                'Candidate': result.candidate,
+                'Score': f"{result.score:.1f}/10",
+                'Recommendation': result.recommendation,
+                'Confidence': result.confidence,
+                'Status': '✅ Success' if result.valid else '❌ Failed'
             })
         
         # Keep only last 10 analyses
         st.session_state.recent_analyses = recent_analyses[-10:]
     
     def _update_progress(self, progress_bar, status_text, idx, total, candidate):
-        """Update progress bar and status text during analysis."""
+        """Update progress bar and status text as each analysis completes."""
         if total > 0:
+            # Resumes are analyzed concurrently, so idx counts completions rather than submissions
             progress = (idx + 1) / total
             progress_bar.progress(progress)
-            status_text.text(f"Processing {candidate} ({idx + 1}/{total})...")
+            status_text.text(f"Analyzed {candidate} ({idx + 1}/{total} done)...")
         
     def _get_score_color_class(self, score: float) -> str:
         """Get CSS class for score color based on value."""
-        if score >= 8.0:
-            return "score-high"
-        elif score >= 6.0:
-            return "score-medium"
-        else:
-            return "score-low"
+        return _SCORE_CLASSES[(score >= 6.0) + (score >= 8.0)]
     
     def _get_recommendation_color_class(self, recommendation: str) -> str:
         """Get CSS class for recommendation color based on value."""
-        recommendation_lower = recommendation.lower()
-        if "strongly recommended" in recommendation_lower:
-            return "recommendation-strong"
-        elif "recommended" in recommendation_lower and "not" not in recommendation_lower:
-            return "recommendation-recommended"
-        elif "conditional" in recommendation_lower:
-            return "recommendation-conditional"
-        else:
-            return "recommendation-not"
+        return _recommendation_class(recommendation)
     
     def _get_confidence_color_class(self, confidence: str) -> str:
         """Get CSS class for confidence color based on value."""
-        confidence_lower = confidence.lower()
-        if confidence_lower == "high":
-            return "confidence-high"
-        elif confidence_lower == "medium":
-            return "confidence-medium"
-        else:
-            return "confidence-low"
+        return _CONFIDENCE_CLASSES.get(confidence.lower(), "confidence-low")
     
     def _format_score_display(self, score: float) -> str:
         """Format score for display with color coding."""
@@ -1,11 +1,24 @@
 from crewai.tools import BaseTool
 from typing import Type, Union, Any
 from pydantic import BaseModel, Field, field_validator
+from collections import OrderedDict
+import hashlib
+import io
+import logging
+import threading
 import pypdf
 import pdfplumber
 import os
 import re
 
+logger = logging.getLogger(__name__)
+
+# Extracted PDF text keyed on the SHA-1 of the file bytes, shared by all tool instances
+# so the same resume is only parsed once no matter how many times it is queried
+_TEXT_CACHE_SIZE = 128
+_text_cache: "OrderedDict[str, str]" = OrderedDict()
+_text_cache_lock = threading.Lock()
+
 
 class CustomPDFToolInput(BaseModel):
     """Input schema for CustomPDFTool."""
@@ -92,62 +105,11 @@ class CustomPDFTool(BaseTool):
             if not isinstance(query, str):
                 query = str(query)
             
-            print(f"[DEBUG] PDF tool received query: '{query}'")
+            logger.debug("PDF tool received query: '%s'", query)
             
-            text_content = ""
-            
-            # Try pdfplumber first (better for text extraction and formatting)
-            try:
-                with pdfplumber.open(self._pdf_file_path) as pdf:
-                    print(f"[DEBUG] Successfully opened PDF with {len(pdf.pages)} pages")
-                    
-                    for page_num, page in enumerate(pdf.pages, 1):
-                        page_text = page.extract_text()
-                        if page_text:
-                            # Apply thorough text sanitization
-                            cleaned_text = sanitize_text(page_text)
-                            if cleaned_text:
-                                text_content += f"\n--- Page {page_num} ---\n{cleaned_text}\n"
-                            else:
-                                print(f"[DEBUG] Page {page_num} text was empty after sanitization")
-                        
-                        # Also try to extract tables if they exist
-                        try:
-                            tables = page.extract_tables()
-                            if tables:
-                                for table_num, table in enumerate(tables, 1):
-                                    text_content += f"\n--- Page {page_num} Table {table_num} ---\n"
-                                    for row in table:
-                                        if row:
-                                            # Apply thorough sanitization to each cell
-                                            clean_row = [sanitize_text(str(cell)) if cell else "" for cell in row]
-                                            text_content += " | ".join(clean_row) + "\n"
-                        except Exception as table_error:
-                            print(f"[DEBUG] Error extracting tables on page {page_num}: {table_error}")
-                        
-            except Exception as pdfplumber_error:
-                print(f"[DEBUG] PDFPlumber failed: {pdfplumber_error}, trying pypdf...")
-                
-                # Fallback to pypdf
-                with open(self._pdf_file_path, 'rb') as file:
-                    pdf_reader = pypdf.PdfReader(file)
-                    print(f"[DEBUG] pypdf opened PDF with {len(pdf_reader.pages)} pages")
-                    
-                    for page_num, page in enumerate(pdf_reader.pages, 1):
-                        try:
-                            page_text = page.extract_text()
-                            if page_text:
-                                # Apply thorough text sanitization
-                                cleaned_text = sanitize_text(page_text)
-                                if cleaned_text:
-                                    text_content += f"\n--- Page {page_num} ---\n{cleaned_text}\n"
-                                else:
-                                    print(f"[DEBUG] pypdf page {page_num} text was empty after sanitization")
-                        except Exception as page_error:
-                            print(f"[DEBUG] Error extracting page {page_num}: {page_error}")
-                            continue
+            text_content = self._extract_text()
             
-            print(f"[DEBUG] Total extracted text length: {len(text_content)} characters")
+            logger.debug("Total extracted text length: %s characters", len(text_content))
             
             if not text_content.strip():
                 return "ERROR: Could not extract any readable text from the PDF. The document may be image-based, corrupted, or password-protected."
@@ -157,7 +119,7 @@ class CustomPDFTool(BaseTool):
             
             if query_lower in ["extract_all", "all", "everything", "complete", "full", "entire", "whole"]:
                 result = f"=== COMPLETE PDF DOCUMENT CONTENT ===\n\n{text_content}\n\n=== END OF DOCUMENT ==="
-                print(f"[DEBUG] Returning complete content ({len(result)} characters)")
+                logger.debug("Returning complete content (%s characters)", len(result))
                 return result
             else:
                 # Ensure text_content is properly sanitized before splitting
@@ -188,16 +150,95 @@ class CustomPDFTool(BaseTool):
                         truncated_msg = ""
                     
                     result = f"=== RELEVANT CONTENT FOR '{query}' ===\n\n" + '\n'.join(relevant_lines) + truncated_msg + "\n\n=== END OF RELEVANT CONTENT ==="
-                    print(f"[DEBUG] Returning relevant content ({len(result)} characters)")
+                    logger.debug("Returning relevant content (%s characters)", len(result))
                     return result
                 else:
                     # If no specific matches, return a substantial sample
                     sample_length = min(5000, len(text_content))
-                    result = f"=== NO EXACT MATCHES FOR '{query}' ===\n\nDocument sample:\n\n{text_content[:sample_length]}{'...\n\n[Document continues]' if len(text_content) > sample_length else ''}\n\n=== END OF SAMPLE ==="
-                    print(f"[DEBUG] No matches found, returning sample ({len(result)} characters)")
+                    continues_msg = "...\n\n[Document continues]" if len(text_content) > sample_length else ""
+                    result = f"=== NO EXACT MATCHES FOR '{query}' ===\n\nDocument sample:\n\n{text_content[:sample_length]}{continues_msg}\n\n=== END OF SAMPLE ==="
+                    logger.debug("No matches found, returning sample (%s characters)", len(result))
                     return result
                     
         except Exception as e:
             error_msg = f"CRITICAL ERROR reading PDF: {str(e)}. The PDF may be corrupted, password-protected, or in an unsupported format."
-            print(f"[DEBUG] {error_msg}")
-            return error_msg
\ No newline at end of file
+            logger.debug("%s", error_msg)
+            return error_msg
+
+    def _extract_text(self) -> str:
+        """Return the PDF's text, parsing it only if this content has not been seen before."""
+        with open(self._pdf_file_path, 'rb') as file:
+            pdf_bytes = file.read()
+        
+        digest = hashlib.sha1(pdf_bytes).hexdigest()
+        with _text_cache_lock:
+            if digest in _text_cache:
+                _text_cache.move_to_end(digest)
+                logger.debug("Using cached text for PDF %s", digest[:12])
+                return _text_cache[digest]
+        
+        text_content = _parse_pdf(pdf_bytes)
+        
+        with _text_cache_lock:
+            _text_cache[digest] = text_content
+            if len(_text_cache) > _TEXT_CACHE_SIZE:
+                _text_cache.popitem(last=False)
+        
+        return text_content
+
+
+def _parse_pdf(pdf_bytes: bytes) -> str:
+    """Extract text and tables from PDF bytes, falling back to pypdf if pdfplumber fails."""
+    text_content = ""
+    
+    # Try pdfplumber first (better for text extraction and formatting)
+    try:
+        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            logger.debug("Successfully opened PDF with %s pages", len(pdf.pages))
+            
+            for page_num, page in enumerate(pdf.pages, 1):
+                page_text = page.extract_text()
+                if page_text:
+                    # Apply thorough text sanitization
+                    cleaned_text = sanitize_text(page_text)
+                    if cleaned_text:
+                        text_content += f"\n--- Page {page_num} ---\n{cleaned_text}\n"
+                    else:
+                        logger.debug("Page %s text was empty after sanitization", page_num)
+                
+                # Also try to extract tables if they exist
+                try:
+                    tables = page.extract_tables()
+                    if tables:
+                        for table_num, table in enumerate(tables, 1):
+                            text_content += f"\n--- Page {page_num} Table {table_num} ---\n"
+                            for row in table:
+                                if row:
+                                    # Apply thorough sanitization to each cell
+                                    clean_row = [sanitize_text(str(cell)) if cell else "" for cell in row]
+                                    text_content += " | ".join(clean_row) + "\n"
+                except Exception as table_error:
+                    logger.debug("Error extracting tables on page %s: %s", page_num, table_error)
+                
+    except Exception as pdfplumber_error:
+        logger.debug("PDFPlumber failed: %s, trying pypdf...", pdfplumber_error)
+        
+        # Fallback to pypdf
+        pdf_reader = pypdf.PdfReader(io.BytesIO(pdf_bytes))
+        logger.debug("pypdf opened PDF with %s pages", len(pdf_reader.pages))
+        
+        for page_num, page in enumerate(pdf_reader.pages, 1):
+            try:
+                page_text = page.extract_text()
+                if page_text:
+                    # Apply thorough text sanitization
+                    cleaned_text = sanitize_text(page_text)
+                    if cleaned_text:
+                        text_content += f"\n--- Page {page_num} ---\n{cleaned_text}\n"
+                    else:
+                        logger.debug("pypdf page %s text was empty after sanitization", page_num)
+            except Exception as page_error:
+                logger.debug("Error extracting page %s: %s", page_num, page_error)
+                continue
+    
+    return text_content
@@ -2,9 +2,9 @@
 Utilities package for resume analysis.
 """
 
-from .file_handler import FileHandler
+from .file_handler import FileHandler, BackgroundWriter
 from .barem_generator import BaremGenerator
 from .report_parser import ReportParser
 from .pdf_validator import PDFValidator
 
-__all__ = ['FileHandler', 'BaremGenerator', 'ReportParser', 'PDFValidator']
+__all__ = ['FileHandler', 'BackgroundWriter', 'BaremGenerator', 'ReportParser', 'PDFValidator']
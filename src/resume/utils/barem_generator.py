@@ -1,9 +1,60 @@
-import json
 import os
+import re
+import time
+import random
+import hashlib
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
-from google import genai
-from google.genai import types
+from typing import TYPE_CHECKING, Dict, Optional
+import orjson
+
+if TYPE_CHECKING:
+    from google import genai
+
+_SANITIZE_RE = re.compile(r'[^\w\-_\. ]')
+
+
+@lru_cache(maxsize=128)
+def _load_barem_from_disk(path_str: str) -> Dict:
+    """Read a cached barem file once per process; raises if it is missing or corrupted, so misses aren't memoized."""
+    with open(path_str, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """Return the first balanced {...} object in text, skipping braces inside JSON strings."""
+    start = text.find('{')
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+@lru_cache(maxsize=1)
+def _gemini_client(api_key: str) -> "genai.Client":
+    """Gemini client reused across barem generations so its connection pool is kept alive."""
+    # google-genai is slow to import, so only load it once a barem actually has to be generated
+    from google import genai
+    return genai.Client(api_key=api_key)
 
 
 class BaremGenerator:
@@ -16,16 +67,16 @@ class BaremGenerator:
     
     def get_barem(self, job_title: str, job_description: str) -> Optional[Dict]:
         """Get or generate barem for the job."""
-        # Create cache filename based on job title
-        cache_filename = self.barem_cache_dir / f"barem_{self._sanitize_job_title(job_title)}.json"
+        # Create cache filename based on job title and description, so editing the
+        # description of an existing title produces a new rubric
+        job_hash = hashlib.sha256(f"{job_title}\0{job_description}".encode('utf-8')).hexdigest()
+        cache_filename = self.barem_cache_dir / f"barem_{self._sanitize_job_title(job_title)}_{job_hash[:16]}.json"
         
         # Try to load from cache
-        if cache_filename.exists():
-            try:
-                with open(cache_filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                pass  # If cache is corrupted, regenerate
+        try:
+            return _load_barem_from_disk(str(cache_filename))
+        except Exception:
+            pass  # If cache is missing or corrupted, regenerate
         
         # Generate new barem
         barem = self._generate_barem_from_gemini(job_title, job_description)
@@ -33,8 +84,8 @@ class BaremGenerator:
         # Save to cache
         if barem:
             try:
-                with open(cache_filename, 'w', encoding='utf-8') as f:
-                    json.dump(barem, f, ensure_ascii=False, indent=2)
+                with open(cache_filename, 'wb') as f:
+                    f.write(orjson.dumps(barem, option=orjson.OPT_INDENT_2))
             except Exception:
                 pass  # Non-critical if cache save fails
         
@@ -42,13 +93,11 @@ class BaremGenerator:
     
     def _sanitize_job_title(self, job_title: str) -> str:
         """Sanitize job title for filename."""
-        import re
-        return re.sub(r'[^\w\-_\. ]', '_', job_title.lower())
+        return _SANITIZE_RE.sub('_', job_title.lower())
     
     def _generate_barem_from_gemini(self, job_title: str, job_description: str) -> Optional[Dict]:
         """Generate barem using Gemini API with retry logic."""
-        import time
-        import random
+        from google.genai import types
         
         max_retries = 3
         base_delay = 1.0
@@ -59,7 +108,7 @@ class BaremGenerator:
                 if not api_key:
                     raise ValueError("GEMINI_API_KEY not found in environment variables")
                 
-                client = genai.Client(api_key=api_key)
+                client = _gemini_client(api_key)
                 
                 prompt = f"""
                 You are a structured hiring evaluation assistant.
@@ -89,10 +138,9 @@ class BaremGenerator:
                 )
                 
                 # Extract JSON from response
-                import re
-                match = re.search(r'\{.*\}', response.text or "", re.DOTALL)
-                if match:
-                    return json.loads(match.group(0))
+                json_text = _extract_json_object(response.text or "")
+                if json_text:
+                    return orjson.loads(json_text)
                 
                 return None
                 
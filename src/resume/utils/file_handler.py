@@ -1,8 +1,29 @@
 import os
 import re
+import atexit
+import logging
+import queue
+import shutil
 import tempfile
+import threading
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SANITIZE_RE = re.compile(r'[^\w\-_\. ]')
+
+# Stage uploads on a RAM-backed filesystem when one is available (Linux tmpfs)
+_UPLOAD_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+@lru_cache(maxsize=4096)
+def _sanitize(name: str) -> str:
+    return _SANITIZE_RE.sub('_', name)
 
 
 class FileHandler:
@@ -10,16 +31,116 @@ class FileHandler:
     
     def __init__(self, output_dir: Path):
         self.output_dir = output_dir
+        # Paths waiting to be removed by flush_cleanup (deque appends are thread-safe)
+        self._pending_cleanup: deque = deque()
     
     def sanitize_filename(self, filename: str) -> str:
         """Sanitize filename to remove problematic characters."""
-        return re.sub(r'[^\w\-_\. ]', '_', filename)
+        return _sanitize(filename)
+    
+    @staticmethod
+    def write_atomic(path: Path, data: bytes) -> None:
+        """Write bytes to a file via a temporary file so readers never see a partial write."""
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def save_upload_streaming(self, uploaded_file: Any, suffix: str = '.pdf') -> Path:
+        """Copy an uploaded file-like object to a temporary file in fixed-size chunks."""
+        uploaded_file.seek(0)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=_UPLOAD_DIR) as tmp_file:
+            shutil.copyfileobj(uploaded_file, tmp_file, length=1024 * 1024)
+        return Path(tmp_file.name)
+    
+    def save_uploads(self, uploaded_files: Iterable[Any], max_workers: int = 4) -> List[Path]:
+        """Save several uploaded files concurrently, returning their temporary paths in input order."""
+        # File writes release the GIL, so the copies overlap on disk
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.save_upload_streaming, uploaded_files))
+    
+    @contextmanager
+    def staged_uploads(self, uploaded_files: List[Any]) -> Iterator[List[Tuple[str, str]]]:
+        """
+        Save uploaded resumes to temporary files for the duration of the block.
+        Yields (file_path, candidate_name) tuples and removes the files on exit.
+        """
+        tmp_paths = self.save_uploads(uploaded_files)
+        try:
+            yield [
+                (str(tmp_path), Path(uploaded_file.name).stem)
+                for tmp_path, uploaded_file in zip(tmp_paths, uploaded_files)
+            ]
+        finally:
+            for tmp_path in tmp_paths:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass  # Already removed by the analysis
+    
+    def schedule_cleanup(self, path: Any) -> None:
+        """Queue a temporary file or working directory for removal by flush_cleanup."""
+        self._pending_cleanup.append(str(path))
+    
+    def flush_cleanup(self) -> None:
+        """Remove every path queued with schedule_cleanup."""
+        while True:
+            # Several batches may flush the same handler concurrently
+            try:
+                path = self._pending_cleanup.popleft()
+            except IndexError:
+                break
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                self.cleanup_temp_file(path)
     
     def cleanup_temp_file(self, file_path: str) -> None:
         """Clean up temporary files safely."""
+        temp_dirs = (tempfile.gettempdir(), _UPLOAD_DIR) if _UPLOAD_DIR else (tempfile.gettempdir(),)
+        if not file_path.startswith(temp_dirs):
+            return
         try:
-            if os.path.exists(file_path) and file_path.startswith(tempfile.gettempdir()):
-                os.remove(file_path)
-        except Exception:
-            pass  # Silent cleanup
+            os.remove(file_path)
+        except OSError:
+            pass  # Silent cleanup, the file may already be gone
+
+
 
+class BackgroundWriter:
+    """
+    Writes small output files (logs, summaries) on a background thread so
+    analysis workers don't block on the filesystem.
+    """
+    
+    def __init__(self):
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, name="resume-writer", daemon=True)
+        self._thread.start()
+        # Don't lose pending writes when the interpreter exits
+        atexit.register(self.flush)
+    
+    def submit(self, path: Path, data: bytes) -> None:
+        """Queue bytes to be written atomically to path."""
+        self._queue.put((path, data))
+    
+    def flush(self) -> None:
+        """Block until every queued write has been performed."""
+        self._queue.join()
+    
+    def _drain(self) -> None:
+        while True:
+            path, data = self._queue.get()
+            try:
+                FileHandler.write_atomic(path, data)
+            except Exception as e:
+                logger.warning(f"Failed to write {path}: {e}")
+            finally:
+                self._queue.task_done()
@@ -1,26 +1,86 @@
 
 # utils/pdf_validator.py
+import os
 import pypdf
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Tuple
+
+try:
+    import fitz  # PyMuPDF, much faster than pypdf when installed
+except ImportError:
+    fitz = None
 
 
 class PDFValidator:
     """Validates PDF files for resume analysis."""
     
-    def validate_pdf(self, file_path: str) -> Tuple[bool, str]:
-        """Validate that the PDF is readable."""
+    def validate_pdf(self, file_path: str, deep: bool = False) -> Tuple[bool, str]:
+        """
+        Validate that the PDF is readable.
+        By default only the page tree is parsed; deep=True also extracts the first page's text.
+        """
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = pypdf.PdfReader(file)
-                num_pages = len(pdf_reader.pages)
-                
-                if num_pages == 0:
-                    return False, "PDF has no pages"
-                
+            stat = os.stat(file_path)
+        except OSError as e:
+            return False, f"PDF validation failed: {str(e)}"
+        
+        # Keyed on modification time and size so an edited file is validated again
+        return _validate_pdf_cached(file_path, stat.st_mtime_ns, stat.st_size, deep)
+    
+    def validate_pdfs(self, file_paths: List[str], deep: bool = False) -> List[Tuple[bool, str]]:
+        """
+        Validate several PDFs, returning the validate_pdf results in input order.
+        Threads overlap the file reads (and PyMuPDF's C code, which releases the GIL)
+        while sharing this process' validation cache.
+        """
+        if len(file_paths) < 2:
+            return [self.validate_pdf(file_path, deep) for file_path in file_paths]
+        
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.validate_pdf, file_paths, [deep] * len(file_paths)))
+
+
+@lru_cache(maxsize=1024)
+def _validate_pdf_cached(file_path: str, mtime_ns: int, size: int, deep: bool) -> Tuple[bool, str]:
+    if fitz is not None:
+        return _validate_with_pymupdf(file_path, deep)
+    
+    try:
+        # pypdf opens and closes the file itself when given a path
+        pdf_reader = pypdf.PdfReader(file_path, strict=False)
+        num_pages = len(pdf_reader.pages)
+        
+        if num_pages == 0:
+            return False, "PDF has no pages"
+        
+        first_page = pdf_reader.pages[0]
+        if deep:
+            # Try to read first page text
+            first_page.extract_text()
+        else:
+            # Resolve the first page object without decoding its content stream
+            first_page.mediabox
+        
+        return True, f"PDF is valid with {num_pages} pages"
+    except Exception as e:
+        return False, f"PDF validation failed: {str(e)}"
+
+
+def _validate_with_pymupdf(file_path: str, deep: bool) -> Tuple[bool, str]:
+    try:
+        with fitz.open(file_path) as doc:
+            num_pages = doc.page_count
+            
+            if num_pages == 0:
+                return False, "PDF has no pages"
+            
+            first_page = doc.load_page(0)
+            if deep:
                 # Try to read first page text
-                first_page = pdf_reader.pages[0]
-                text = first_page.extract_text()
-                
-                return True, f"PDF is valid with {num_pages} pages"
-        except Exception as e:
-            return False, f"PDF validation failed: {str(e)}"
\ No newline at end of file
+                first_page.get_text("text")
+            
+            return True, f"PDF is valid with {num_pages} pages"
+    except Exception as e:
+        return False, f"PDF validation failed: {str(e)}"
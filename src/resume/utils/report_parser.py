@@ -1,15 +1,118 @@
 import os
 import re
-import json
-from typing import Dict, List, Any
+import copy
+import mmap
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+import orjson
+
+_NON_SPACE_RE = re.compile(rb'\S')
+
+# Score and recommendation labels, matched in a single scan of the report. The score
+# labels are case-insensitive (robust to headers, bold, and variants); recommendation
+# values are captured in lookaheads so a long decision line doesn't hide later labels.
+# A '**Final Combined Score:**' label and a '# Final Combined Score:' header also
+# count as plain labeled scores
+_LABELS_RE = re.compile(
+    r'(?P<score>(?i:\*\*Overall Score:\*\*|Overall Score:|TOTAL WEIGHTED SCORE:|(?P<score_bold_label>\*\*Final Combined Score:\*\*)'
+    r'|Final Combined Score:)\s*(?P<score_value>[\d\.]+)(?P<score_ten>\s*/\s*10)?)'
+    r'|(?P<score_header>(?i:#+\s*Final Combined Score(?P<score_header_colon>:)?)\s*'
+    r'(?P<score_header_value>[\d\.]+)(?P<score_header_ten>\s*/\s*10)?)'
+    r'|\*\*Decision:\*\* (?=(?P<decision>[^\n]+))'
+    r'|#+\s*Final Recommendation:?\s*(?=(?P<header>[A-Z ]+))'
+    r'|-?\s*\*\*Final Recommendation:\*\*\s*(?=(?P<bold>[A-Z ]+))'
+    r'|Final Recommendation:?\s*(?=(?P<plain>[A-Z ]+))'
+)
+# '**Decision:** ...' first, then '## Final Recommendation: ...', '- **Final Recommendation:** ...'
+# and finally any line with 'Final Recommendation:'
+_RECOMMENDATION_PRIORITY = ('decision', 'header', 'bold', 'plain')
+# Labeled scores written as "x / 10" first, then any labeled score, then the bold
+# '**Final Combined Score:**' label and last the loose '## Final Combined Score x'
+# header form, each preferring "x / 10"
+_SCORE_PRIORITY = (
+    'score_ten', 'score', 'score_bold_ten', 'score_bold', 'score_header_ten', 'score_header'
+)
+# Section headings are fixed literals, so sections are located with str.find
+_STRENGTHS_HEADER = '### ✅ Strengths\n'
+_GAPS_HEADER = '### ❌ Gaps'
+_WEIGHTED_SCORE_HEADER = '## Weighted Score Analysis'
+# One non-empty line of a bullet list, without its leading "- " and trailing dashes/spaces
+_BULLET_RE = re.compile(r'^[\s\-]*([^\s\-](?:[^\n]*[^\s\-])?)', re.MULTILINE)
+
+
+def _find_section(content: str, header: str, terminator: str, pos: int = 0) -> Optional[Tuple[str, int]]:
+    """
+    Text between the first header at or after pos and the next (non-adjacent) terminator,
+    with the terminator's index; None if either is missing.
+    """
+    start = content.find(header, pos)
+    if start == -1:
+        return None
+    start += len(header)
+    end = content.find(terminator, start + 1)
+    if end == -1:
+        return None
+    return content[start:end], end
+
+
+def _is_number(value: Optional[str]) -> bool:
+    """Whether a captured score value parses as a float."""
+    if value is None:
+        return False
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _item_texts(items: List[Any], key: str) -> List[str]:
+    """Text of each report list item (the given key of dict items), skipping empty ones."""
+    return [
+        text for item in items
+        if (text := item.get(key, '') if isinstance(item, dict) else str(item))
+    ]
 
 
 class ReportParser:
     """Parses analysis reports to extract structured data."""
     
+    def __init__(self):
+        # Parsed reports keyed on (path, mtime, size, candidate name), so a rewritten file is parsed again
+        self._parse_cached = lru_cache(maxsize=256)(self._parse_report_file)
+    
     def parse_report(self, report_path: str, candidate_name: str) -> Dict[str, Any]:
         """Parse the report file to extract scores and recommendations."""
-        result = {
+        try:
+            stat = os.stat(report_path)
+        except OSError:
+            result = self._empty_result(candidate_name, report_path)
+            result["valid"] = False
+            result["error"] = "Report file not found"
+            return result
+        
+        # Hand out a copy so callers can't alter the cached result
+        return copy.deepcopy(
+            self._parse_cached(report_path, stat.st_mtime_ns, stat.st_size, candidate_name)
+        )
+    
+    @staticmethod
+    def get_report_content(report_path: Optional[str]) -> str:
+        """
+        Read the full text of a parsed report.
+        Results only keep "report_path", so the text is loaded on demand.
+        """
+        if not report_path:
+            return ""
+        try:
+            with open(report_path, 'rb') as f:
+                return f.read().decode('utf-8', errors='replace')
+        except OSError:
+            return ""
+    
+    def _empty_result(self, candidate_name: str, report_path: str) -> Dict[str, Any]:
+        """Result skeleton shared by every parse outcome."""
+        return {
             "candidate_name": candidate_name,
             "valid": True,
             "error": "",
@@ -17,176 +120,154 @@ class ReportParser:
             "recommendation": "Unknown",
             "strengths": [],
             "gaps": [],
-            "report_content": ""
+            "report_path": report_path
         }
+    
+    def _parse_report_file(
+        self,
+        report_path: str,
+        mtime_ns: int,
+        size: int,
+        candidate_name: str
+    ) -> Dict[str, Any]:
+        """Read and parse a report; mtime_ns and size only key the cache."""
+        result = self._empty_result(candidate_name, report_path)
         
-        if not os.path.exists(report_path):
+        try:
+            with open(report_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    # An empty file can't be memory-mapped
+                    return self._parse_report_buffer(b'', candidate_name, report_path)
+                
+                # Map the report instead of reading it into an intermediate bytes copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as report_map:
+                    with memoryview(report_map) as report_view:
+                        return self._parse_report_buffer(report_view, candidate_name, report_path)
+            
+        except FileNotFoundError:
+            # Removed between the stat in parse_report and the open
             result["valid"] = False
             result["error"] = "Report file not found"
             return result
-        
-        try:
-            with open(report_path, 'r', encoding='utf-8') as f:
-                report_content = f.read()
-            
-            result["report_content"] = report_content
-            
-            # Try to parse as JSON first (new format)
-            try:
-                json_data = json.loads(report_content)
-                return self._parse_json_report(json_data, candidate_name)
-            except json.JSONDecodeError:
-                # Fall back to markdown parsing (old format)
-                return self._parse_markdown_report(report_content, candidate_name)
-            
         except Exception as e:
             result["valid"] = False
             result["error"] = f"Error parsing report: {str(e)}"
             return result
     
-    def _parse_json_report(self, json_data: Dict[str, Any], candidate_name: str) -> Dict[str, Any]:
-        """Parse JSON format report (new structure)."""
-        result = {
-            "candidate_name": candidate_name,
-            "valid": True,
-            "error": "",
-            "score": 0,
-            "recommendation": "Unknown",
-            "strengths": [],
-            "gaps": [],
-            "report_content": json.dumps(json_data, indent=2)
-        }
+    def _parse_report_buffer(self, report_buffer: Any, candidate_name: str, report_path: str) -> Dict[str, Any]:
+        """Parse report bytes (any bytes-like object) as JSON, or as markdown if they aren't JSON."""
+        # Only reports that look like JSON (new format) go through the JSON parser,
+        # which reads the UTF-8 bytes directly
+        first_char = _NON_SPACE_RE.search(report_buffer)
+        if first_char and report_buffer[first_char.start()] in b'{[':
+            try:
+                json_data = orjson.loads(report_buffer)
+                return self._parse_json_report(json_data, candidate_name, report_path)
+            except orjson.JSONDecodeError:
+                pass
         
-        # Extract executive summary information
+        # Fall back to markdown parsing (old format), decoding only now
+        return self._parse_markdown_report(str(report_buffer, 'utf-8'), candidate_name, report_path)
+    
+    def _parse_json_report(
+        self,
+        json_data: Dict[str, Any],
+        candidate_name: str,
+        report_path: str
+    ) -> Dict[str, Any]:
+        """Parse JSON format report (new structure)."""
         executive_summary = json_data.get('executive_summary', {})
-        result["candidate_name"] = executive_summary.get('candidate_name', candidate_name)
-        result["score"] = executive_summary.get('overall_score', 0)
-        result["recommendation"] = executive_summary.get('overall_recommendation', 'Unknown')
-        
-        # Extract strengths from the new structure
         strengths_data = json_data.get('strengths_and_differentiators', {})
-        core_strengths = strengths_data.get('core_strengths', [])
-        unique_values = strengths_data.get('unique_value_propositions', [])
-        
-        strengths = []
-        for strength in core_strengths:
-            if isinstance(strength, dict):
-                strengths.append(strength.get('strength', ''))
-            else:
-                strengths.append(str(strength))
-        
-        for value in unique_values:
-            if isinstance(value, dict):
-                strengths.append(value.get('value_proposition', ''))
-            else:
-                strengths.append(str(value))
-        
-        result["strengths"] = [s for s in strengths if s]
-        
-        # Extract gaps from the new structure
         gaps_data = json_data.get('gaps_and_risk_assessment', {})
-        critical_gaps = gaps_data.get('critical_gaps', [])
-        risk_factors = gaps_data.get('performance_risk_factors', [])
-        
-        gaps = []
-        for gap in critical_gaps:
-            if isinstance(gap, dict):
-                gaps.append(gap.get('gap', ''))
-            else:
-                gaps.append(str(gap))
-        
-        for risk in risk_factors:
-            if isinstance(risk, dict):
-                gaps.append(risk.get('risk', ''))
-            else:
-                gaps.append(str(risk))
-        
-        result["gaps"] = [g for g in gaps if g]
-        
-        # Add the full JSON data to the result for comprehensive access
-        result.update(json_data)
         
+        result = self._empty_result(candidate_name, report_path)
+        result.update(
+            # Extract executive summary information
+            candidate_name=executive_summary.get('candidate_name', candidate_name),
+            # A missing or null score is left at the "not found" default
+            score=executive_summary.get('overall_score') or 0,
+            recommendation=executive_summary.get('overall_recommendation', 'Unknown'),
+            # Extract strengths and gaps from the new structure
+            strengths=(
+                _item_texts(strengths_data.get('core_strengths', []), 'strength')
+                + _item_texts(strengths_data.get('unique_value_propositions', []), 'value_proposition')
+            ),
+            gaps=(
+                _item_texts(gaps_data.get('critical_gaps', []), 'gap')
+                + _item_texts(gaps_data.get('performance_risk_factors', []), 'risk')
+            ),
+            # Keep the full JSON data for comprehensive access, without letting its keys
+            # overwrite the fields extracted above
+            raw=json_data
+        )
         return result
     
-    def _parse_markdown_report(self, content: str, candidate_name: str) -> Dict[str, Any]:
+    def _parse_markdown_report(self, content: str, candidate_name: str, report_path: str) -> Dict[str, Any]:
         """Parse markdown format report (old structure)."""
-        result = {
-            "candidate_name": candidate_name,
-            "valid": True,
-            "error": "",
-            "score": 0,
-            "recommendation": "Unknown",
-            "strengths": [],
-            "gaps": [],
-            "report_content": content
-        }
-        
-        # Extract score using multiple patterns
-        score = self._extract_score(content)
-        result["score"] = score
-        
-        # Extract recommendation
-        recommendation = self._extract_recommendation(content)
-        result["recommendation"] = recommendation
-        
-        # Extract strengths and gaps
-        result["strengths"] = self._extract_strengths(content)
-        result["gaps"] = self._extract_gaps(content)
+        score, recommendation = self._extract_score_and_recommendation(content)
+        strengths, gaps = self._extract_strengths_and_gaps(content)
         
+        result = self._empty_result(candidate_name, report_path)
+        result.update(score=score, recommendation=recommendation, strengths=strengths, gaps=gaps)
         return result
     
-    def _extract_score(self, content: str) -> float:
-        """Extract numeric score from report content."""
-        # Patterns for score extraction (robust to headers, bold, and variants)
-        patterns = [
-            r'(?:\*\*Overall Score:\*\*|Overall Score:|TOTAL WEIGHTED SCORE:|Final Combined Score:|\*\*Final Combined Score:\*\*)\s*([\d\.]+)\s*/\s*10',
-            r'(?:\*\*Overall Score:\*\*|Overall Score:|TOTAL WEIGHTED SCORE:|Final Combined Score:|\*\*Final Combined Score:\*\*)\s*([\d\.]+)',
-            r'-?\s*\*\*Final Combined Score:\*\*\s*([\d\.]+)\s*/\s*10',
-            r'-?\s*\*\*Final Combined Score:\*\*\s*([\d\.]+)',
-            r'#+\s*Final Combined Score:?\s*([\d\.]+)\s*/\s*10',
-            r'#+\s*Final Combined Score:?\s*([\d\.]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                try:
-                    return float(match.group(1))
-                except Exception:
-                    continue
-        return 0.0
+    def _extract_score_and_recommendation(self, content: str) -> Tuple[float, str]:
+        """
+        Extract the numeric score and the recommendation from report content in one pass.
+        Each kind of score label keeps its first value; the highest-priority kind whose
+        value is a number wins (see _SCORE_PRIORITY).
+        """
+        scores = {}
+        recommendations = {}
+        for match in _LABELS_RE.finditer(content):
+            kind = match.lastgroup
+            if kind == 'score' or kind == 'score_header':
+                value = match.group(f'{kind}_value')
+                out_of_ten = match.group(f'{kind}_ten')
+                kinds = [kind]
+                if kind == 'score' and match.group('score_bold_label'):
+                    kinds.append('score_bold')
+                elif kind == 'score_header' and match.group('score_header_colon'):
+                    kinds.append('score')
+                for score_kind in kinds:
+                    scores.setdefault(score_kind, value)
+                    if out_of_ten:
+                        scores.setdefault(f'{score_kind}_ten', value)
+            else:
+                recommendations.setdefault(kind, match.group(kind))
+            
+            # Nothing later in the report can change the outcome
+            if 'decision' in recommendations and _is_number(scores.get('score_ten')):
+                break
+        
+        score = 0.0
+        for kind in _SCORE_PRIORITY:
+            if _is_number(scores.get(kind)):
+                score = float(scores[kind])
+                break
+        
+        for kind in _RECOMMENDATION_PRIORITY:
+            if kind in recommendations:
+                return score, recommendations[kind].strip()
+        return score, "Unknown"
     
-    def _extract_recommendation(self, content: str) -> str:
-        """Extract recommendation from report content."""
-        # Try '**Decision:** ...' first
-        match = re.search(r'\*\*Decision:\*\* ([^\n]+)', content)
-        if match:
-            return match.group(1).strip()
-        # Try markdown header style (e.g., '## Final Recommendation: ...')
-        match = re.search(r'#+\s*Final Recommendation:?\s*([A-Z ]+)', content)
-        if match:
-            return match.group(1).strip()
-        # Try bolded label (e.g., '- **Final Recommendation:** ...')
-        match = re.search(r'-?\s*\*\*Final Recommendation:\*\*\s*([A-Z ]+)', content)
-        if match:
-            return match.group(1).strip()
-        # Try any line with 'Final Recommendation:'
-        match = re.search(r'Final Recommendation:?\s*([A-Z ]+)', content)
-        if match:
-            return match.group(1).strip()
-        return "Unknown"
+    def _extract_strengths_and_gaps(self, content: str) -> Tuple[List[str], List[str]]:
+        """Extract strengths and gaps from report content in a single pass when possible."""
+        strengths = _find_section(content, _STRENGTHS_HEADER, _GAPS_HEADER + '\n')
+        if strengths:
+            # The gaps section starts where the strengths section ends
+            gaps = _find_section(content, _GAPS_HEADER + '\n', _WEIGHTED_SCORE_HEADER, strengths[1])
+            if gaps:
+                return _BULLET_RE.findall(strengths[0]), _BULLET_RE.findall(gaps[0])
+        # Reports missing one of the sections or the closing heading
+        return self._extract_strengths(content), self._extract_gaps(content)
     
     def _extract_strengths(self, content: str) -> List[str]:
         """Extract strengths from report content."""
-        match = re.search(r'### ✅ Strengths\n([\s\S]+?)### ❌ Gaps', content)
-        if match:
-            strengths = match.group(1).strip().split('\n')
-            return [s.strip('- ').strip() for s in strengths if s.strip()]
-        return []
+        section = _find_section(content, _STRENGTHS_HEADER, _GAPS_HEADER)
+        return _BULLET_RE.findall(section[0]) if section else []
     
     def _extract_gaps(self, content: str) -> List[str]:
         """Extract gaps from report content."""
-        match = re.search(r'### ❌ Gaps\n([\s\S]+?)## Weighted Score Analysis', content)
-        if match:
-            gaps = match.group(1).strip().split('\n')
-            return [g.strip('- ').strip() for g in gaps if g.strip()]
-        return []
\ No newline at end of file
+        section = _find_section(content, _GAPS_HEADER + '\n', _WEIGHTED_SCORE_HEADER)
+        return _BULLET_RE.findall(section[0]) if section else []
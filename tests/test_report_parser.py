@@ -0,0 +1,17 @@
+from utils.report_parser import ReportParser
+
+
+def test_labeled_score_wins_over_earlier_header_score():
+    content = "## Final Combined Score 4\n**Overall Score:** 7.5\n"
+    score, _ = ReportParser()._extract_score_and_recommendation(content)
+    assert score == 7.5
+
+
+def test_header_score_used_when_no_labeled_score():
+    content = "## Final Combined Score 4\n## Final Recommendation: HIRE\n"
+    assert ReportParser()._extract_score_and_recommendation(content) == (4.0, "HIRE")
+
+
+def test_score_out_of_ten_preferred():
+    content = "Overall Score: 6\nTOTAL WEIGHTED SCORE: 8.2 / 10\n**Decision:** HIRE\n"
+    assert ReportParser()._extract_score_and_recommendation(content) == (8.2, "HIRE")